@@ -1,11 +1,13 @@
 from ._version import __version__
 from .interviewer import MCPInterviewer
+from .llm_cache import LLMCache
 from .main import main
 from .models import Client, ServerParameters, ServerScoreCard
 
 __all__ = [
     "__version__",
     "MCPInterviewer",
+    "LLMCache",
     "main",
     "Client",
     "ServerParameters",
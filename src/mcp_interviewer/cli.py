@@ -1,5 +1,6 @@
 import argparse
 import sys
+from pathlib import Path
 
 
 def cli():
@@ -81,6 +82,22 @@ def cli():
         action="store_true",
         help="Enable functional testing of the server",
     )
+    parser.add_argument(
+        "--max-step-concurrency",
+        default=1,
+        type=int,
+        help="Maximum number of independent functional test steps to run concurrently.",
+    )
+    parser.add_argument(
+        "--max-llm-concurrency",
+        default=16,
+        type=int,
+        help="Maximum number of concurrent LLM judging requests.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching LLM responses across runs. Identical requests reuse cached responses instead of calling the model again.",
+    )
     parser.add_argument(
         "--accept-risk",
         action="store_true",
@@ -213,6 +230,9 @@ def cli():
         no_collapse=args.no_collapse,
         selected_constraints=args.constraints,
         fail_on_warnings=args.fail_on_warnings,
+        max_step_concurrency=args.max_step_concurrency,
+        max_llm_concurrency=args.max_llm_concurrency,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
     )
 
     sys.exit(exit_code)
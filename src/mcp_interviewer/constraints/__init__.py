@@ -81,11 +81,4 @@ def get_selected_constraints(
                 result.append(constraint_class)
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_result = []
-    for cls in result:
-        if cls not in seen:
-            seen.add(cls)
-            unique_result.append(cls)
-
-    return unique_result
+    return list(dict.fromkeys(result))
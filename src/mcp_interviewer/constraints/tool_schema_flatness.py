@@ -1,4 +1,5 @@
 from collections.abc import Generator
+from contextlib import suppress
 from typing import Any
 
 from jsonschema import RefResolver
@@ -48,6 +49,16 @@ class ToolInputSchemaFlatnessConstraint(ToolConstraint):
         # Create a resolver for handling $ref references
         resolver = RefResolver.from_schema(tool.inputSchema)
 
+        # Local "#/definitions/X" and "#/$defs/X" refs are looked up directly;
+        # names needing JSON pointer escaping fall back to the resolver
+        local_refs = {
+            f"#/{keyword}/{name}": definition
+            for keyword in ("definitions", "$defs")
+            if isinstance(definitions := tool.inputSchema.get(keyword), dict)
+            for name, definition in definitions.items()
+            if not any(c in name for c in "/~%")
+        }
+
         def has_nested_structure(
             obj: Any,
             resolver: RefResolver,
@@ -89,15 +100,16 @@ class ToolInputSchemaFlatnessConstraint(ToolConstraint):
                     return False
                 visited.add(ref_url)
 
-                try:
-                    _, resolved = resolver.resolve(ref_url)
+                # If resolution fails, skip this ref
+                with suppress(Exception):
+                    if ref_url in local_refs:
+                        resolved = local_refs[ref_url]
+                    else:
+                        _, resolved = resolver.resolve(ref_url)
                     if isinstance(resolved, dict) and has_nested_structure(
                         resolved, resolver, depth, inside_array, visited
                     ):
                         return True
-                except Exception:
-                    # If resolution fails, skip this ref
-                    pass
 
             # Recursively check all values in the current object
             for key, value in obj.items():
@@ -10,7 +10,11 @@ from .callbacks import (
 )
 from .connection import mcp_client
 from .inspection import inspect_server
-from .test_execution import execute_functional_test, execute_functional_test_step
+from .test_execution import (
+    execute_functional_test,
+    execute_functional_test_step,
+    partition_functional_test_steps,
+)
 from .test_generation import generate_functional_test
 from .test_judging import judge_functional_test, judge_functional_test_step
 from .tool_judging import judge_tool
@@ -26,6 +30,7 @@ __all__ = [
     "logging_callback",
     "mcp_client",
     "MCPInterviewer",
+    "partition_functional_test_steps",
     "sampling_callback",
     "judge_functional_test",
     "judge_functional_test_step",
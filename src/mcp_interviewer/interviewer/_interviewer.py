@@ -14,6 +14,7 @@ from mcp.types import (
     Tool,
 )
 
+from ..llm_cache import LLMCache
 from ..models import (
     Client,
     FunctionalTest,
@@ -44,6 +45,7 @@ from .test_judging import (
 from .test_judging import (
     judge_functional_test_step as _judge_functional_test_step,
 )
+from .tool_judging import _NA_TOOL_SCORECARD
 from .tool_judging import judge_tool as _judge_tool
 
 logger = logging.getLogger(__name__)
@@ -64,6 +66,9 @@ class MCPInterviewer:
         should_run_functional_test: bool = False,
         should_judge_tool: bool = False,
         should_judge_functional_test: bool = False,
+        max_step_concurrency: int = 1,
+        max_llm_concurrency: int = 16,
+        cache: LLMCache | None = None,
     ):
         """Initialize the MCP Interviewer.
 
@@ -72,12 +77,18 @@ class MCPInterviewer:
             model: Model name to use for evaluation (e.g., "gpt-4o") (None if not using LLM features)
             should_judge_tool: Whether to perform expensive experimental LLM judging of tools (default: False)
             should_judge_functional_test: Whether to perform expensive experimental LLM judging of functional tests (default: False)
+            max_step_concurrency: Maximum number of independent functional test steps to execute concurrently (default: 1)
+            max_llm_concurrency: Maximum number of LLM judging requests in flight at once (default: 16)
+            cache: Optional cache of LLM responses reused across runs (default: None)
         """
         self._client = client
         self._model = model
         self._should_run_functional_test = should_run_functional_test
         self._should_judge_tool = should_judge_tool
         self._should_judge_functional_test = should_judge_functional_test
+        self._max_step_concurrency = max_step_concurrency
+        self._llm_semaphore = asyncio.Semaphore(max(1, max_llm_concurrency))
+        self._cache = cache
         self._request_counters = create_request_counters()
 
     async def judge_tool(self, tool: Tool) -> ToolScoreCard:
@@ -94,9 +105,10 @@ class MCPInterviewer:
         """
         if self._client is None or self._model is None:
             raise ValueError("Client and model are required for tool judging")
-        return await _judge_tool(
-            self._client, self._model, tool, self._should_judge_tool
-        )
+        async with self._llm_semaphore:
+            return await _judge_tool(
+                self._client, self._model, tool, self._should_judge_tool, self._cache
+            )
 
     async def generate_functional_test(self, server: Server) -> FunctionalTest:
         """Generate a functional test plan for the server's tools.
@@ -117,7 +129,9 @@ class MCPInterviewer:
             raise ValueError(
                 "Client and model are required for functional test generation"
             )
-        return await generate_functional_test(self._client, self._model, server)
+        return await generate_functional_test(
+            self._client, self._model, server, self._cache
+        )
 
     async def execute_functional_test_step(
         self, session: ClientSession, step: FunctionalTestStep
@@ -141,8 +155,9 @@ class MCPInterviewer:
     ) -> tuple[FunctionalTestOutput, list[FunctionalTestStepOutput]]:
         """Execute all steps of a functional test.
 
-        Runs through all test steps sequentially, collecting outputs and tracking
-        the total number of requests made during the test execution.
+        Runs through all test steps, collecting outputs and tracking the total
+        number of requests made during the test execution. Independent steps
+        may run concurrently, bounded by max_step_concurrency.
 
         Args:
             session: The MCP ClientSession to use for tool calls
@@ -154,7 +169,9 @@ class MCPInterviewer:
         Raises:
             Exception: If any test step fails critically
         """
-        return await execute_functional_test(session, test, self._request_counters)
+        return await execute_functional_test(
+            session, test, self._request_counters, self._max_step_concurrency
+        )
 
     async def judge_functional_test_step(
         self, step: FunctionalTestStep, output: FunctionalTestStepOutput
@@ -178,13 +195,14 @@ class MCPInterviewer:
             raise ValueError(
                 "Client and model are required for functional test step judging"
             )
-        return await _judge_functional_test_step(
-            self._client,
-            self._model,
-            step,
-            output,
-            self._should_judge_functional_test,
-        )
+        async with self._llm_semaphore:
+            return await _judge_functional_test_step(
+                self._client,
+                self._model,
+                step,
+                output,
+                self._should_judge_functional_test,
+            )
 
     async def judge_functional_test(
         self,
@@ -219,6 +237,7 @@ class MCPInterviewer:
             output,
             step_outputs,
             self._should_judge_functional_test,
+            self._llm_semaphore,
         )
 
     async def inspect_server(
@@ -325,13 +344,74 @@ class MCPInterviewer:
         """Get the current number of logging requests."""
         return self._request_counters["logging"]
 
+    async def _judge_tools(self, server: Server) -> list[ToolScoreCard]:
+        """Phase 2: judge every tool, dropping tools whose judging failed."""
+        logger.info("=" * 60)
+        logger.info("PHASE 2: Tool Quality Assessment")
+        logger.info("=" * 60)
+        if not server.tools:
+            logger.info("No tools found")
+            return []
+
+        if not self._should_judge_tool:
+            logger.info(
+                f"Skipping judging for {len(server.tools)} tools (judging disabled)"
+            )
+            return [_NA_TOOL_SCORECARD] * len(server.tools)
+
+        logger.info(f"Evaluating {len(server.tools)} tools")
+        tool_scorecards = await asyncio.gather(
+            *[self.judge_tool(tool) for tool in server.tools],
+            return_exceptions=True,
+        )
+
+        # Log any errors from tool judging
+        successful_scorecards = []
+        for i, scorecard in enumerate(tool_scorecards):
+            if isinstance(scorecard, Exception):
+                logger.error(
+                    "Tool %s judging failed: %s", server.tools[i].name, scorecard
+                )
+            else:
+                successful_scorecards.append(scorecard)
+
+        return successful_scorecards
+
+    async def _run_functional_test(
+        self, session: ClientSession, server: Server
+    ) -> FunctionalTestScoreCard | None:
+        """Phase 3: generate, execute and judge a functional test if enabled."""
+        if not self._should_run_functional_test:
+            logger.info("=" * 60)
+            logger.info("PHASE 3: Functional Testing - SKIPPED")
+            logger.info("=" * 60)
+            return None
+
+        logger.info("=" * 60)
+        logger.info("PHASE 3: Functional Testing")
+        logger.info("=" * 60)
+
+        functional_test = await self.generate_functional_test(server)
+
+        (
+            functional_test_output,
+            functional_test_step_outputs,
+        ) = await self.execute_functional_test(session, functional_test)
+
+        # Judge functional test
+        return await self.judge_functional_test(
+            functional_test,
+            functional_test_output,
+            functional_test_step_outputs,
+        )
+
     async def interview_server(self, params: ServerParameters) -> ServerScoreCard:
         """Perform a complete evaluation of an MCP server.
 
         This is the main entry point that orchestrates the entire evaluation process:
         1. Server inspection to discover capabilities
         2. Tool quality assessment for all discovered tools
-        3. Functional testing to verify server behavior
+        3. Functional testing to verify server behavior (concurrently with 2)
         4. Compilation of results into a comprehensive scorecard
 
         Args:
@@ -370,61 +450,32 @@ class MCPInterviewer:
                     logger.info("=" * 60)
                     server = await self.inspect_server(params, session)
 
-                    # Phase 2: Tool Scoring
-                    logger.info("=" * 60)
-                    logger.info("PHASE 2: Tool Quality Assessment")
-                    logger.info("=" * 60)
-                    if server.tools:
-                        logger.info(f"Evaluating {len(server.tools)} tools")
-                        tool_scorecards = await asyncio.gather(
-                            *[self.judge_tool(tool) for tool in server.tools],
-                            return_exceptions=True,
+                    # Phase 2 (tool judging) only talks to the LLM, while Phase 3
+                    # (functional testing) mostly waits on the server, so run the
+                    # two concurrently.
+                    tool_scorecards_task = asyncio.create_task(
+                        self._judge_tools(server)
+                    )
+                    try:
+                        functional_test_scorecard = await self._run_functional_test(
+                            session, server
                         )
-
-                        # Log any errors from tool judging
-                        successful_scorecards = []
-                        for i, scorecard in enumerate(tool_scorecards):
-                            if isinstance(scorecard, Exception):
-                                logger.error(
-                                    f"Tool {server.tools[i].name} judging failed: {scorecard}"
-                                )
-                            else:
-                                successful_scorecards.append(scorecard)
-
-                        tool_scorecards = successful_scorecards
-                    else:
-                        logger.info("No tools found")
-                        tool_scorecards = []
-
-                    # Phase 3: Functional Testing
-                    if self._should_run_functional_test:
-                        logger.info("=" * 60)
-                        logger.info("PHASE 3: Functional Testing")
-                        logger.info("=" * 60)
-
-                        functional_test = await self.generate_functional_test(server)
-
-                        (
-                            functional_test_output,
-                            functional_test_step_outputs,
-                        ) = await self.execute_functional_test(session, functional_test)
-
-                        # Judge functional test
-                        functional_test_scorecard = await self.judge_functional_test(
-                            functional_test,
-                            functional_test_output,
-                            functional_test_step_outputs,
+                        tool_scorecards = await tool_scorecards_task
+                    finally:
+                        # If functional testing failed, stop judging and wait for
+                        # it so no LLM call is left running and its outcome is
+                        # always retrieved
+                        tool_scorecards_task.cancel()
+                        await asyncio.gather(
+                            tool_scorecards_task, return_exceptions=True
                         )
-                    else:
-                        logger.info("=" * 60)
-                        logger.info("PHASE 3: Functional Testing - SKIPPED")
-                        logger.info("=" * 60)
-                        functional_test_scorecard = None
 
                     # Create final scorecard
                     logger.info("Creating final server scorecard")
-                    scorecard = ServerScoreCard(
-                        **server.model_dump(),
+                    # Every field is already a validated model, so skip the
+                    # dump/re-validate round trip
+                    scorecard = ServerScoreCard.model_construct(
+                        **dict(server),
                         model=self._model or "N/A",
                         tool_scorecards=tool_scorecards,
                         functional_test_scorecard=functional_test_scorecard,
@@ -436,6 +487,6 @@ class MCPInterviewer:
 
                     return scorecard
         except Exception as e:
-            logger.error(f"Evaluation failed: {e}", exc_info=True)
+            logger.error("Evaluation failed: %s", e, exc_info=True)
             logger.error("=" * 60)
             raise
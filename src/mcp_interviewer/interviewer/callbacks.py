@@ -1,5 +1,7 @@
 """MCP session callback functions."""
 
+from collections.abc import Generator
+from contextlib import contextmanager
 from typing import Any
 
 from mcp.client.session import ClientSession
@@ -16,6 +18,18 @@ from mcp.types import (
 )
 from pydantic import FileUrl
 
+# Canned responses shared by every callback invocation. They are only
+# serialized back to the server, never mutated.
+_DUMMY_SAMPLING_RESULT = CreateMessageResult(
+    role="assistant",
+    content=TextContent(type="text", text="Dummy content"),
+    model="dummy",
+)
+_DUMMY_ELICIT_RESULT = ElicitResult(action="cancel")
+_DUMMY_LIST_ROOTS_RESULT = ListRootsResult(
+    roots=[Root(uri=FileUrl("file://dummy.txt"))]
+)
+
 
 def create_request_counters() -> dict[str, int]:
     """Create a new request counters dictionary."""
@@ -27,6 +41,33 @@ def create_request_counters() -> dict[str, int]:
     }
 
 
+@contextmanager
+def count_requests(
+    request_counters: dict[str, int],
+) -> Generator[dict[str, int], None, None]:
+    """Count the requests received while the block runs.
+
+    Yields a dict that, once the block exits, holds the number of requests of
+    each kind counted inside the block, keyed like the request counters.
+
+    Args:
+        request_counters: Dict containing request counters for tracking
+    """
+    start = dict(request_counters)
+    counts: dict[str, int] = {}
+    try:
+        yield counts
+    finally:
+        counts.update(
+            {key: value - start.get(key, 0) for key, value in request_counters.items()}
+        )
+
+
+def request_count_fields(request_counts: dict[str, int]) -> dict[str, int]:
+    """Map request counts to the *_requests fields of the output models."""
+    return {f"{key}_requests": value for key, value in request_counts.items()}
+
+
 async def sampling_callback(
     request_counters: dict[str, int],
     context: RequestContext[ClientSession, Any],
@@ -45,11 +86,7 @@ async def sampling_callback(
         CreateMessageResult with dummy content
     """
     request_counters["sampling"] += 1
-    return CreateMessageResult(
-        role="assistant",
-        content=TextContent(type="text", text="Dummy content"),
-        model="dummy",
-    )
+    return _DUMMY_SAMPLING_RESULT
 
 
 async def elicitation_callback(
@@ -70,7 +107,7 @@ async def elicitation_callback(
         ElicitResult with cancel action
     """
     request_counters["elicitation"] += 1
-    return ElicitResult(action="cancel")
+    return _DUMMY_ELICIT_RESULT
 
 
 async def list_roots_callback(
@@ -89,7 +126,7 @@ async def list_roots_callback(
         ListRootsResult with a dummy file root
     """
     request_counters["list_roots"] += 1
-    return ListRootsResult(roots=[Root(uri=FileUrl("file://dummy.txt"))])
+    return _DUMMY_LIST_ROOTS_RESULT
 
 
 async def logging_callback(
@@ -1,12 +1,54 @@
 """MCP client connection management."""
 
-from contextlib import asynccontextmanager
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
 
 from mcp import stdio_client
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
 
-from ..models import ServerParameters
+from ..models import (
+    ServerParameters,
+    SseServerParameters,
+    StdioServerParameters,
+    StreamableHttpServerParameters,
+)
+
+
+@asynccontextmanager
+async def _stdio_streams(params: StdioServerParameters):
+    async with stdio_client(params) as (read, write):
+        yield read, write
+
+
+@asynccontextmanager
+async def _sse_streams(params: SseServerParameters):
+    async with sse_client(
+        params.url,
+        headers=params.headers,
+        timeout=params.timeout,
+        sse_read_timeout=params.sse_read_timeout,
+    ) as (read, write):
+        yield read, write
+
+
+@asynccontextmanager
+async def _streamable_http_streams(params: StreamableHttpServerParameters):
+    async with streamablehttp_client(
+        params.url,
+        headers=params.headers,
+        timeout=params.timeout,
+        sse_read_timeout=params.sse_read_timeout,
+    ) as (read, write, _):
+        yield read, write
+
+
+_CLIENT_FACTORIES: dict[str, Callable[[Any], AbstractAsyncContextManager[Any]]] = {
+    "stdio": _stdio_streams,
+    "sse": _sse_streams,
+    "streamable_http": _streamable_http_streams,
+}
 
 
 @asynccontextmanager
@@ -19,24 +61,8 @@ async def mcp_client(params: ServerParameters):
     Yields:
         Tuple of (read_stream, write_stream) for the MCP client connection
     """
-    if params.connection_type == "stdio":
-        async with stdio_client(params) as (read, write):
-            yield read, write
-    elif params.connection_type == "sse":
-        async with sse_client(
-            params.url,
-            headers=params.headers,
-            timeout=params.timeout,
-            sse_read_timeout=params.sse_read_timeout,
-        ) as (read, write):
-            yield read, write
-    elif params.connection_type == "streamable_http":
-        async with streamablehttp_client(
-            params.url,
-            headers=params.headers,
-            timeout=params.timeout,
-            sse_read_timeout=params.sse_read_timeout,
-        ) as (read, write, _):
-            yield read, write
-    else:
+    factory = _CLIENT_FACTORIES.get(params.connection_type)
+    if factory is None:
         raise ValueError(f"Unknown connection type: {params.connection_type}")
+    async with factory(params) as (read, write):
+        yield read, write
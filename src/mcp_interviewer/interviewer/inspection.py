@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from mcp import ClientSession
 
@@ -10,6 +12,50 @@ from ..models import Server, ServerParameters
 logger = logging.getLogger(__name__)
 
 
+async def _empty() -> list:
+    return []
+
+
+async def _list_all(
+    name: str,
+    list_fn: Callable[..., Awaitable[Any]],
+    items_attr: str,
+) -> list:
+    """Fetch every page of a paginated MCP list request.
+
+    Args:
+        name: Human readable name of the listed items, used for logging
+        list_fn: Session method performing the list request, accepting a cursor
+        items_attr: Name of the result attribute holding the listed items
+
+    Returns:
+        All listed items, or an empty list if listing failed
+    """
+    items = []
+    try:
+        result = await list_fn()
+        items.extend(getattr(result, items_attr))
+        logger.debug("Initial %s batch: %d %s", name, len(items), name)
+
+        while result.nextCursor:
+            logger.debug(
+                "Fetching next batch of %s with cursor: %s", name, result.nextCursor
+            )
+            result = await list_fn(result.nextCursor)
+            batch = getattr(result, items_attr)
+            items.extend(batch)
+            logger.debug("Retrieved %d more %s", len(batch), name)
+
+        logger.info(f"Successfully fetched {len(items)} total {name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for item in items:
+                logger.debug("Found %s: %s", name, item.name)
+    except Exception as e:
+        logger.warning("Failed to list %s: %s", name, e)
+        logger.debug("Failed to list %s", name, exc_info=True)
+    return items
+
+
 async def inspect_server(server: ServerParameters, session: ClientSession) -> Server:
     """Inspect an MCP server to discover its capabilities and features.
 
@@ -30,119 +76,46 @@ async def inspect_server(server: ServerParameters, session: ClientSession) -> Se
         )
     else:
         logger.info(f"Starting server inspection for: {server.url}")
-    logger.debug(f"Server parameters: {server}")
+    logger.debug("Server parameters: %s", server)
 
     logger.info("Initializing client session...")
     initialize_result = await session.initialize()
-    await asyncio.sleep(0.2)
     logger.info("Client session initialized successfully")
-    logger.debug(f"Server capabilities: {initialize_result.capabilities}")
-    tools = []
-    resources = []
-    resource_templates = []
-    prompts = []
+    logger.debug("Server capabilities: %s", initialize_result.capabilities)
+    capabilities = initialize_result.capabilities
 
-    if initialize_result.capabilities.tools is not None:
+    if capabilities.tools is not None:
         logger.info("Server supports tools capability - fetching tools")
-        try:
-            result = await session.list_tools()
-            logger.debug(f"Initial tools batch: {len(result.tools)} tools")
-
-            while result.nextCursor:
-                tools.extend(result.tools)
-                logger.debug(
-                    f"Fetching next batch of tools with cursor: {result.nextCursor}"
-                )
-                result = await session.list_tools(result.nextCursor)
-                logger.debug(f"Retrieved {len(result.tools)} more tools")
-
-            tools.extend(result.tools)
-            logger.info(f"Successfully fetched {len(tools)} total tools")
-            for tool in tools:
-                logger.debug(f"Tool found: {tool.name}")
-        except Exception as e:
-            logger.warning(f"Failed to list tools: {e}", exc_info=True)
+        tools_task = _list_all("tools", session.list_tools, "tools")
     else:
         logger.info("Server does not support tools capability")
+        tools_task = _empty()
 
-    if initialize_result.capabilities.resources is not None:
+    if capabilities.resources is not None:
         logger.info("Server supports resources capability - fetching resources")
-        try:
-            result = await session.list_resources()
-            logger.debug(f"Initial resources batch: {len(result.resources)} resources")
-
-            while result.nextCursor:
-                resources.extend(result.resources)
-                logger.debug(
-                    f"Fetching next batch of resources with cursor: {result.nextCursor}"
-                )
-                result = await session.list_resources(result.nextCursor)
-                logger.debug(f"Retrieved {len(result.resources)} more resources")
-
-            resources.extend(result.resources)
-            logger.info(f"Successfully fetched {len(resources)} total resources")
-            for resource in resources:
-                logger.debug(
-                    f"Resource found: {resource.name if hasattr(resource, 'name') else resource}"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to list resources: {e}", exc_info=True)
-
+        resources_task = _list_all("resources", session.list_resources, "resources")
         logger.info("Fetching resource templates")
-
-        try:
-            result = await session.list_resource_templates()
-            logger.debug(
-                f"Initial resource templates batch: {len(result.resourceTemplates)} templates"
-            )
-
-            while result.nextCursor:
-                resource_templates.extend(result.resourceTemplates)
-                logger.debug(
-                    f"Fetching next batch of resource templates with cursor: {result.nextCursor}"
-                )
-                result = await session.list_resource_templates(result.nextCursor)
-                logger.debug(
-                    f"Retrieved {len(result.resourceTemplates)} more templates"
-                )
-
-            resource_templates.extend(result.resourceTemplates)
-            logger.info(
-                f"Successfully fetched {len(resource_templates)} total resource templates"
-            )
-            for template in resource_templates:
-                logger.debug(
-                    f"Resource template found: {template.name if hasattr(template, 'name') else template}"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to list resource templates: {e}", exc_info=True)
+        resource_templates_task = _list_all(
+            "resource templates",
+            session.list_resource_templates,
+            "resourceTemplates",
+        )
     else:
         logger.info("Server does not support resources capability")
+        resources_task = _empty()
+        resource_templates_task = _empty()
 
-    if initialize_result.capabilities.prompts is not None:
+    if capabilities.prompts is not None:
         logger.info("Server supports prompts capability - fetching prompts")
-        try:
-            result = await session.list_prompts()
-            logger.debug(f"Initial prompts batch: {len(result.prompts)} prompts")
-
-            while result.nextCursor:
-                prompts.extend(result.prompts)
-                logger.debug(
-                    f"Fetching next batch of prompts with cursor: {result.nextCursor}"
-                )
-                result = await session.list_prompts(result.nextCursor)
-                logger.debug(f"Retrieved {len(result.prompts)} more prompts")
-
-            prompts.extend(result.prompts)
-            logger.info(f"Successfully fetched {len(prompts)} total prompts")
-            for prompt in prompts:
-                logger.debug(
-                    f"Prompt found: {prompt.name if hasattr(prompt, 'name') else prompt}"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to list prompts: {e}", exc_info=True)
+        prompts_task = _list_all("prompts", session.list_prompts, "prompts")
     else:
         logger.info("Server does not support prompts capability")
+        prompts_task = _empty()
+
+    # The listings are independent, so fetch them concurrently
+    tools, resources, resource_templates, prompts = await asyncio.gather(
+        tools_task, resources_task, resource_templates_task, prompts_task
+    )
 
     logger.info("Server inspection completed successfully")
     logger.info(
@@ -158,5 +131,5 @@ async def inspect_server(server: ServerParameters, session: ClientSession) -> Se
         resource_templates=resource_templates,
         prompts=prompts,
     )
-    logger.debug(f"Created Server object: {server_obj}")
+    logger.debug("Created Server object: %s", server_obj)
     return server_obj
@@ -1,5 +1,6 @@
 """Test execution functionality."""
 
+import asyncio
 import logging
 
 from mcp import ClientSession
@@ -10,6 +11,7 @@ from ..models import (
     FunctionalTestStep,
     FunctionalTestStepOutput,
 )
+from .callbacks import count_requests, create_request_counters, request_count_fields
 
 logger = logging.getLogger(__name__)
 
@@ -32,47 +34,76 @@ async def execute_functional_test_step(
     Returns:
         FunctionalTestStepOutput with the tool output and request tracking data
     """
-    start_sampling_requests = request_counters["sampling"]
-    start_elicitation_requests = request_counters["elicitation"]
-    start_list_roots_requests = request_counters["list_roots"]
-    start_logging_requests = request_counters["logging"]
     exception = None
-    try:
-        logger.debug(f"Calling tool '{step.tool_name}'")
-        result = await session.call_tool(step.tool_name, step.tool_arguments)
-    except Exception as e:
-        logger.error(
-            f"Failed to execute test step '{step.tool_name}': {e}", exc_info=True
-        )
-        result = None
-        exception = str(e)
-
-    logger.debug(f"Tool output: {result}")
+    with count_requests(request_counters) as request_counts:
+        try:
+            logger.debug("Calling tool '%s'", step.tool_name)
+            result = await session.call_tool(step.tool_name, step.tool_arguments)
+        except Exception as e:
+            logger.error(
+                "Failed to execute test step '%s': %s",
+                step.tool_name,
+                e,
+                exc_info=True,
+            )
+            result = None
+            exception = str(e)
+
+    logger.debug("Tool output: %s", result)
     return FunctionalTestStepOutput(
         tool_output=result,
         exception=exception,
-        sampling_requests=request_counters["sampling"] - start_sampling_requests,
-        elicitation_requests=request_counters["elicitation"]
-        - start_elicitation_requests,
-        list_roots_requests=request_counters["list_roots"] - start_list_roots_requests,
-        logging_requests=request_counters["logging"] - start_logging_requests,
+        **request_count_fields(request_counts),
     )
 
 
+def partition_functional_test_steps(
+    steps: list[FunctionalTestStep],
+) -> list[list[FunctionalTestStep]]:
+    """Group consecutive steps into batches that can run concurrently.
+
+    A step that depends on previous steps starts a new batch, so it only runs
+    once every earlier step has completed. Independent steps join the current
+    batch.
+
+    Args:
+        steps: The steps of a functional test, in plan order
+
+    Returns:
+        List of batches preserving the original step order
+    """
+    batches: list[list[FunctionalTestStep]] = []
+    for step in steps:
+        if not batches or step.depends_on_previous:
+            batches.append([step])
+        else:
+            batches[-1].append(step)
+    return batches
+
+
 async def execute_functional_test(
     session: ClientSession,
     test: FunctionalTest,
     request_counters: dict[str, int],
+    max_step_concurrency: int = 1,
 ) -> tuple[FunctionalTestOutput, list[FunctionalTestStepOutput]]:
     """Execute all steps of a functional test.
 
-    Runs through all test steps sequentially, collecting outputs and tracking
-    the total number of requests made during the test execution.
+    Runs through all test steps, collecting outputs and tracking the total
+    number of requests made during the test execution. When
+    max_step_concurrency is greater than 1, consecutive steps that do not
+    depend on previous steps are executed concurrently.
+
+    Server-initiated requests (sampling, elicitation, etc.) cannot be
+    attributed to a specific tool call, so per-step request counts of
+    concurrently executed steps may include requests triggered by sibling
+    steps. Aggregate counts are unaffected.
 
     Args:
         session: The MCP ClientSession to use for tool calls
         test: The FunctionalTest containing all test steps to execute
         request_counters: Dict containing request counters for tracking
+        max_step_concurrency: Maximum number of steps to execute at once (default: 1)
 
     Returns:
         Tuple of (FunctionalTestOutput with aggregate request counts, list of step outputs)
@@ -80,31 +111,38 @@ async def execute_functional_test(
     Raises:
         Exception: If any test step fails critically
     """
-    logger.debug(f"Starting test execution with {len(test.steps)} steps")
+    n = len(test.steps)
+    logger.debug("Starting test execution with %d steps", n)
 
     # Reset counters
-    request_counters.update(
-        {
-            "sampling": 0,
-            "elicitation": 0,
-            "list_roots": 0,
-            "logging": 0,
-        }
-    )
+    request_counters.update(create_request_counters())
+
+    if max_step_concurrency > 1:
+        batches = partition_functional_test_steps(test.steps)
+    else:
+        batches = [[step] for step in test.steps]
+
+    semaphore = asyncio.Semaphore(max(1, max_step_concurrency))
+
+    async def execute_step(i: int, step: FunctionalTestStep):
+        async with semaphore:
+            logger.info("Step %d/%d: %s", i, n, step.tool_name)
+            try:
+                return await execute_functional_test_step(
+                    session, step, request_counters
+                )
+            except Exception as e:
+                logger.error("Step %d/%d failed: %s", i, n, e)
+                raise
 
     step_outputs = []
-    for i, step in enumerate(test.steps, 1):
-        logger.info(f"Step {i}/{len(test.steps)}: {step.tool_name}")
-        try:
-            output = await execute_functional_test_step(session, step, request_counters)
-            step_outputs.append(output)
-        except Exception as e:
-            logger.error(f"Step {i}/{len(test.steps)} failed: {e}")
-            raise
-
-    return FunctionalTestOutput(
-        sampling_requests=request_counters["sampling"],
-        elicitation_requests=request_counters["elicitation"],
-        list_roots_requests=request_counters["list_roots"],
-        logging_requests=request_counters["logging"],
-    ), step_outputs
+    i = 1
+    for batch in batches:
+        step_outputs.extend(
+            await asyncio.gather(
+                *[execute_step(i + j, step) for j, step in enumerate(batch)]
+            )
+        )
+        i += len(batch)
+
+    return FunctionalTestOutput(**request_count_fields(request_counters)), step_outputs
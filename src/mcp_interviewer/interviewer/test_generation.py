@@ -1,15 +1,17 @@
 """Functional test generation functionality."""
 
+import json
 import logging
 
 from .. import prompts
+from ..llm_cache import LLMCache
 from ..models import Client, FunctionalTest, Server
 
 logger = logging.getLogger(__name__)
 
 
 async def generate_functional_test(
-    client: Client, model: str, server: Server
+    client: Client, model: str, server: Server, cache: LLMCache | None = None
 ) -> FunctionalTest:
     """Generate a functional test plan for the server's tools.
 
@@ -20,6 +22,7 @@ async def generate_functional_test(
         client: OpenAI client (sync or async) for LLM-based evaluation
         model: Model name to use for evaluation
         server: The Server object containing tools and capabilities to test
+        cache: Optional cache to reuse the test plan for an unchanged server
 
     Returns:
         FunctionalTest containing a test plan and steps to execute
@@ -27,12 +30,39 @@ async def generate_functional_test(
     Raises:
         Exception: If test generation fails
     """
+    if cache is None:
+        return await _generate_functional_test_with_llm(client, model, server)
+
+    server_info = server.initialize_result.serverInfo
+    cache_key = cache.make_key(
+        "generate_functional_test",
+        prompts.PROMPT_VERSION,
+        model,
+        server_info.model_dump_json(),
+        *sorted(
+            json.dumps(tool.model_dump(mode="json"), sort_keys=True)
+            for tool in server.tools
+        ),
+    )
+    cached = cache.get(cache_key, FunctionalTest)
+    if cached is not None:
+        logger.info("Using cached test plan with %d steps", len(cached.steps))
+        return cached
+
+    test = await _generate_functional_test_with_llm(client, model, server)
+    cache.set(cache_key, test)
+    return test
+
+
+async def _generate_functional_test_with_llm(
+    client: Client, model: str, server: Server
+) -> FunctionalTest:
     try:
-        logger.debug(f"Generating functional test for {len(server.tools)} tools")
+        logger.debug("Generating functional test for %d tools", len(server.tools))
         test = await prompts.generate_functional_test(client, model, server)
-        logger.info(f"Generated test plan with {len(test.steps)} steps")
-        logger.debug(f"Test plan: {test.plan}")
-        return test
     except Exception as e:
-        logger.error(f"Failed to generate functional test: {e}", exc_info=True)
+        logger.error("Failed to generate functional test: %s", e, exc_info=True)
         raise
+    logger.info("Generated test plan with %d steps", len(test.steps))
+    logger.debug("Test plan: %s", test.plan)
+    return test
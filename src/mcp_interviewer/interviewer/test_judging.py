@@ -1,20 +1,58 @@
 """Test judging functionality."""
 
+import asyncio
 import logging
+from contextlib import nullcontext
 
 from .. import prompts
 from ..models import (
     Client,
+    ErrorType,
     FunctionalTest,
     FunctionalTestOutput,
     FunctionalTestScoreCard,
     FunctionalTestStep,
     FunctionalTestStepOutput,
     FunctionalTestStepScoreCard,
+    PassFailScoreCard,
+    ScoreCard,
 )
 
 logger = logging.getLogger(__name__)
 
+# Rubric entries used when judging is disabled
+_NA_SCORECARD = PassFailScoreCard(justification="No score generated", score="N/A")
+_NA_ERROR_TYPE = ScoreCard[ErrorType](justification="No score generated", score="N/A")
+
+
+def _na_step_scorecard(
+    step: FunctionalTestStep, output: FunctionalTestStepOutput
+) -> FunctionalTestStepScoreCard:
+    """Build a step scorecard with N/A rubric entries for disabled judging."""
+    return FunctionalTestStepScoreCard(
+        # Include the step data
+        justification=step.justification,
+        expected_output=step.expected_output,
+        tool_name=step.tool_name,
+        tool_arguments=step.tool_arguments,
+        depends_on_previous=step.depends_on_previous,
+        # Include the output data
+        tool_output=output.tool_output,
+        exception=output.exception,
+        sampling_requests=output.sampling_requests,
+        elicitation_requests=output.elicitation_requests,
+        list_roots_requests=output.list_roots_requests,
+        logging_requests=output.logging_requests,
+        # Add the evaluation rubric with N/A scores
+        error_handling=_NA_SCORECARD,
+        error_type=_NA_ERROR_TYPE,
+        no_silent_error=_NA_SCORECARD,
+        output_relevance=_NA_SCORECARD,
+        output_quality=_NA_SCORECARD,
+        schema_compliance=_NA_SCORECARD,
+        meets_expectations=_NA_SCORECARD,
+    )
+
 
 async def judge_functional_test_step(
     client: Client,
@@ -45,46 +83,14 @@ async def judge_functional_test_step(
         logger.info(
             f"Skipping judging for test step '{step.tool_name}' (judging disabled)"
         )
-        from ..models import ErrorType, PassFailScoreCard, ScoreCard
-
-        na_scorecard = PassFailScoreCard(
-            justification="No score generated", score="N/A"
-        )
-
-        # Create error type scorecard with the correct literal type
-        na_error_type = ScoreCard[ErrorType](
-            justification="No score generated", score="N/A"
-        )
-
-        return FunctionalTestStepScoreCard(
-            # Include the step data
-            justification=step.justification,
-            expected_output=step.expected_output,
-            tool_name=step.tool_name,
-            tool_arguments=step.tool_arguments,
-            # Include the output data
-            tool_output=output.tool_output,
-            exception=output.exception,
-            sampling_requests=output.sampling_requests,
-            elicitation_requests=output.elicitation_requests,
-            list_roots_requests=output.list_roots_requests,
-            logging_requests=output.logging_requests,
-            # Add the evaluation rubric with N/A scores
-            error_handling=na_scorecard,
-            error_type=na_error_type,
-            no_silent_error=na_scorecard,
-            output_relevance=na_scorecard,
-            output_quality=na_scorecard,
-            schema_compliance=na_scorecard,
-            meets_expectations=na_scorecard,
-        )
+        return _na_step_scorecard(step, output)
 
     try:
-        logger.debug(f"Judging step '{step.tool_name}'")
+        logger.debug("Judging step '%s'", step.tool_name)
         scorecard = await prompts.score_functional_test_step_output(
             client, model, step, output
         )
-        logger.debug(f"Step scorecard: {scorecard}")
+        logger.debug("Step scorecard: %s", scorecard)
         return scorecard
     except Exception as e:
         logger.error(
@@ -100,6 +106,7 @@ async def judge_functional_test(
     output: FunctionalTestOutput,
     step_outputs: list[FunctionalTestStepOutput],
     should_judge: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> FunctionalTestScoreCard:
     """Judge the entire functional test output.
 
@@ -113,6 +120,7 @@ async def judge_functional_test(
         output: The FunctionalTestOutput containing all step results
         step_outputs: List of individual step outputs
         should_judge: Whether to perform expensive experimental LLM judging
+        semaphore: Optional semaphore bounding the number of concurrent LLM requests
 
     Returns:
         FunctionalTestScoreCard with overall test judging and individual step scores
@@ -121,26 +129,16 @@ async def judge_functional_test(
         Exception: If test judging fails
     """
 
-    step_scorecards: list[FunctionalTestStepScoreCard] = []
-    for step, step_output in zip(test.steps, step_outputs):
-        step_scorecard = await judge_functional_test_step(
-            client, model, step, step_output, should_judge
-        )
-        step_scorecards.append(step_scorecard)
-
     if not should_judge:
+        logger.info(
+            f"Skipping judging for {len(test.steps)} test steps (judging disabled)"
+        )
+        step_scorecards = [
+            _na_step_scorecard(step, step_output)
+            for step, step_output in zip(test.steps, step_outputs)
+        ]
         logger.debug("Skipping overall functional test judging (judging disabled)")
         # Return a scorecard with N/A values for the overall test
-        from ..models import ErrorType, PassFailScoreCard, ScoreCard
-
-        na_scorecard = PassFailScoreCard(
-            justification="No score generated", score="N/A"
-        )
-
-        na_error_type = ScoreCard[ErrorType](
-            justification="No score generated", score="N/A"
-        )
-
         return FunctionalTestScoreCard(
             # Include the test plan and steps
             plan=test.plan,
@@ -151,21 +149,40 @@ async def judge_functional_test(
             list_roots_requests=output.list_roots_requests,
             logging_requests=output.logging_requests,
             # Add the evaluation rubric with N/A scores
-            meets_expectations=na_scorecard,
-            error_type=na_error_type,
+            meets_expectations=_NA_SCORECARD,
+            error_type=_NA_ERROR_TYPE,
         )
 
+    async def judge_step(
+        step: FunctionalTestStep, step_output: FunctionalTestStepOutput
+    ) -> FunctionalTestStepScoreCard:
+        async with semaphore or nullcontext():
+            return await judge_functional_test_step(
+                client, model, step, step_output, should_judge
+            )
+
+    # Steps are judged independently, so issue all judging requests at once
+    step_scorecards: list[FunctionalTestStepScoreCard] = list(
+        await asyncio.gather(
+            *[
+                judge_step(step, step_output)
+                for step, step_output in zip(test.steps, step_outputs)
+            ]
+        )
+    )
+
     try:
         logger.debug(f"Judging test with {len(test.steps)} steps")
-        scorecard = await prompts.judge_functional_test_output(
-            client,
-            model,
-            test,
-            output,
-            step_scorecards,
-        )
-        logger.debug(f"Test scorecard: {scorecard}")
+        async with semaphore or nullcontext():
+            scorecard = await prompts.judge_functional_test_output(
+                client,
+                model,
+                test,
+                output,
+                step_scorecards,
+            )
+        logger.debug("Test scorecard: %s", scorecard)
         return scorecard
     except Exception as e:
-        logger.error(f"Failed to judge functional test: {e}", exc_info=True)
+        logger.error("Failed to judge functional test: %s", e, exc_info=True)
         raise
@@ -1,17 +1,58 @@
 """Tool evaluation functionality."""
 
+import json
 import logging
 
 from mcp.types import Tool
 
 from .. import prompts
-from ..models import Client, ToolScoreCard
+from ..llm_cache import LLMCache
+from ..models import (
+    Client,
+    PassFailScoreCard,
+    ToolDescriptionScoreCard,
+    ToolNameScoreCard,
+    ToolSchemaScoreCard,
+    ToolScoreCard,
+)
 
 logger = logging.getLogger(__name__)
 
+# Scorecard returned for every tool when judging is disabled. It is shared
+# between tools, so treat it as read-only.
+_NA_SCORECARD = PassFailScoreCard(justification="No score generated", score="N/A")
+_NA_TOOL_SCORECARD = ToolScoreCard(
+    tool_name=ToolNameScoreCard(
+        length=_NA_SCORECARD,
+        uniqueness=_NA_SCORECARD,
+        descriptiveness=_NA_SCORECARD,
+    ),
+    tool_description=ToolDescriptionScoreCard(
+        length=_NA_SCORECARD,
+        parameters=_NA_SCORECARD,
+        examples=_NA_SCORECARD,
+    ),
+    tool_input_schema=ToolSchemaScoreCard(
+        complexity=_NA_SCORECARD,
+        parameters=_NA_SCORECARD,
+        optionals=_NA_SCORECARD,
+        constraints=_NA_SCORECARD,
+    ),
+    tool_output_schema=ToolSchemaScoreCard(
+        complexity=_NA_SCORECARD,
+        parameters=_NA_SCORECARD,
+        optionals=_NA_SCORECARD,
+        constraints=_NA_SCORECARD,
+    ),
+)
+
 
 async def judge_tool(
-    client: Client, model: str, tool: Tool, should_judge: bool = False
+    client: Client,
+    model: str,
+    tool: Tool,
+    should_judge: bool = False,
+    cache: LLMCache | None = None,
 ) -> ToolScoreCard:
     """Judge a single tool based on its name, description, and schema quality.
 
@@ -20,6 +61,7 @@ async def judge_tool(
         model: Model name to use for evaluation
         tool: The Tool object to evaluate
         should_judge: Whether to perform expensive experimental LLM judging
+        cache: Optional cache to reuse judgments of identical tools across runs
 
     Returns:
         ToolScoreCard containing scores for tool name, description, and schema quality
@@ -29,48 +71,33 @@ async def judge_tool(
     """
     if not should_judge:
         logger.info(f"Skipping judging for tool '{tool.name}' (judging disabled)")
-        # Return a scorecard with N/A values
-        from ..models import (
-            PassFailScoreCard,
-            ToolDescriptionScoreCard,
-            ToolNameScoreCard,
-            ToolSchemaScoreCard,
-        )
+        return _NA_TOOL_SCORECARD
+
+    if cache is None:
+        return await _judge_tool_with_llm(client, model, tool)
+
+    cache_key = cache.make_key(
+        "judge_tool",
+        prompts.PROMPT_VERSION,
+        model,
+        json.dumps(tool.model_dump(mode="json"), sort_keys=True),
+    )
+    cached = cache.get(cache_key, ToolScoreCard)
+    if cached is not None:
+        logger.debug("Using cached scorecard for tool '%s'", tool.name)
+        return cached
 
-        na_scorecard = PassFailScoreCard(
-            justification="No score generated", score="N/A"
-        )
+    scorecard = await _judge_tool_with_llm(client, model, tool)
+    cache.set(cache_key, scorecard)
+    return scorecard
 
-        return ToolScoreCard(
-            tool_name=ToolNameScoreCard(
-                length=na_scorecard,
-                uniqueness=na_scorecard,
-                descriptiveness=na_scorecard,
-            ),
-            tool_description=ToolDescriptionScoreCard(
-                length=na_scorecard,
-                parameters=na_scorecard,
-                examples=na_scorecard,
-            ),
-            tool_input_schema=ToolSchemaScoreCard(
-                complexity=na_scorecard,
-                parameters=na_scorecard,
-                optionals=na_scorecard,
-                constraints=na_scorecard,
-            ),
-            tool_output_schema=ToolSchemaScoreCard(
-                complexity=na_scorecard,
-                parameters=na_scorecard,
-                optionals=na_scorecard,
-                constraints=na_scorecard,
-            ),
-        )
 
+async def _judge_tool_with_llm(client: Client, model: str, tool: Tool) -> ToolScoreCard:
     try:
-        logger.debug(f"Judging tool '{tool.name}'")
+        logger.debug("Judging tool '%s'", tool.name)
         scorecard = await prompts.judge_tool(client, model, tool)
-        logger.debug(f"Tool scorecard for '{tool.name}': {scorecard}")
-        return scorecard
     except Exception as e:
-        logger.error(f"Failed to judge tool '{tool.name}': {e}", exc_info=True)
+        logger.error("Failed to judge tool '%s': %s", tool.name, e, exc_info=True)
         raise
+    logger.debug("Tool scorecard for '%s': %s", tool.name, scorecard)
+    return scorecard
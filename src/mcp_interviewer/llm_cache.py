@@ -0,0 +1,97 @@
+"""On-disk cache for structured LLM responses."""
+
+import hashlib
+import logging
+from contextlib import suppress
+from pathlib import Path
+from typing import TypeVar
+from uuid import uuid4
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+class LLMCache:
+    """Exact-match cache of LLM responses stored as JSON files in a directory.
+
+    Entries are keyed by a hash of everything that determines the response
+    (e.g. the prompt version, model name and serialized input), so a cached
+    response is only reused for an identical request.
+    """
+
+    def __init__(self, directory: Path | str):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store cache entries in (created on first write)
+        """
+        self._directory = Path(directory)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the parts that determine a response.
+
+        Args:
+            *parts: Strings identifying the request
+
+        Returns:
+            Hex digest uniquely identifying the combination of parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def get(self, key: str, response_model: type[TModel]) -> TModel | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+            response_model: Pydantic model to validate the cached response with
+
+        Returns:
+            The cached response, or None on a miss or an unreadable entry
+        """
+        path = self._path(key)
+        try:
+            data = path.read_text()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        try:
+            return response_model.model_validate_json(data)
+        except ValidationError:
+            logger.warning("Ignoring invalid cache entry %s", path)
+            return None
+
+    def set(self, key: str, response: BaseModel) -> None:
+        """Store a response in the cache.
+
+        Failing to write is logged and otherwise ignored, so a broken cache
+        directory never costs a response.
+
+        Args:
+            key: Cache key from make_key
+            response: The response to store
+        """
+        path = self._path(key)
+        # Write to a temporary file first so readers never see partial entries
+        tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(response.model_dump_json())
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to write cache entry %s: %s", path, e)
+            with suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
@@ -5,6 +5,7 @@ from pathlib import Path
 from .constraints import get_selected_constraints
 from .constraints.base import Severity
 from .interviewer import MCPInterviewer
+from .llm_cache import LLMCache
 from .models import Client, ServerParameters
 from .reports import FullReport
 from .reports.base import BaseReportOptions
@@ -12,6 +13,9 @@ from .reports.custom import CustomReport
 
 logger = logging.getLogger(__name__)
 
+_REPORT_FILENAME = "mcp-interview.md"
+_JSON_FILENAME = "mcp-interview.json"
+
 
 async def amain(
     client: Client | None,
@@ -25,6 +29,9 @@ async def amain(
     no_collapse: bool = False,
     selected_constraints: list[str] | None = None,
     fail_on_warnings: bool = False,
+    max_step_concurrency: int = 1,
+    max_llm_concurrency: int = 16,
+    cache_dir: Path | None = None,
 ) -> int:
     """Asynchronous main function to evaluate an MCP server and generate reports.
 
@@ -44,6 +51,9 @@ async def amain(
         no_collapse: If True, don't use collapsible sections in the report (default: False)
         selected_constraints: List of constraint names or codes to check (all if None)
         fail_on_warnings: Return a non-zero exit code if any constraint violations with WARNING severity are encountered. (default: False)
+        max_step_concurrency: Maximum number of independent functional test steps to execute concurrently (default: 1)
+        max_llm_concurrency: Maximum number of LLM judging requests in flight at once (default: 16)
+        cache_dir: Directory for caching LLM responses across runs (caching disabled if None)
     """
     exit_code = 0
 
@@ -57,6 +67,9 @@ async def amain(
             should_run_functional_test,
             should_judge_tool,
             should_judge_functional_test,
+            max_step_concurrency,
+            max_llm_concurrency,
+            LLMCache(cache_dir) if cache_dir is not None else None,
         )
     else:
         # Create a minimal interviewer that only does server inspection
@@ -73,11 +86,11 @@ async def amain(
     logger.info("=" * 60)
     logger.info("PHASE 4: Constraint Checking")
     logger.info("=" * 60)
-    violations = []
-    constraint_classes = get_selected_constraints(selected_constraints)
-    for constraint_class in constraint_classes:
-        constraint = constraint_class()
-        violations.extend(list(constraint.test(interview)))
+    violations = [
+        violation
+        for constraint_class in get_selected_constraints(selected_constraints)
+        for violation in constraint_class().test(interview)
+    ]
 
     if violations:
         for violation in violations:
@@ -102,9 +115,10 @@ async def amain(
     )
 
     # Generate the appropriate report based on options
+    out_dir = Path(out_dir)
+    path = out_dir / _REPORT_FILENAME
     if custom_reports:
         # Custom report with selected components
-        path = out_dir / Path("mcp-interview.md")
         logger.info(
             f"Saving custom interview with reports: {', '.join(custom_reports)} to {path}"
         )
@@ -115,13 +129,12 @@ async def amain(
             fd.write(report.build())
     else:
         # Full report (default)
-        path = out_dir / Path("mcp-interview.md")
         logger.info(f"Saving full interview to {path}")
         with open(path, "w") as fd:
             report = FullReport(interview, violations, options, selected_constraints)
             fd.write(report.build())
 
-    path = out_dir / Path("mcp-interview.json")
+    path = out_dir / _JSON_FILENAME
     logger.info(f"Saving interview json data to {path}")
     with open(path, "w") as fd:
         fd.write(interview.model_dump_json(indent=2))
@@ -141,6 +154,9 @@ def main(
     no_collapse: bool = False,
     selected_constraints: list[str] | None = None,
     fail_on_warnings: bool = False,
+    max_step_concurrency: int = 1,
+    max_llm_concurrency: int = 16,
+    cache_dir: Path | None = None,
 ) -> int:
     """Synchronous wrapper for the main evaluation function.
 
@@ -155,6 +171,10 @@ def main(
         custom_reports: List of specific report names to include
         no_collapse: If True, don't use collapsible sections in the report (default: False)
         selected_constraints: List of constraint names or codes to check (all if None)
+        fail_on_warnings: Return a non-zero exit code if any constraint violations with WARNING severity are encountered. (default: False)
+        max_step_concurrency: Maximum number of independent functional test steps to execute concurrently (default: 1)
+        max_llm_concurrency: Maximum number of LLM judging requests in flight at once (default: 16)
+        cache_dir: Directory for caching LLM responses across runs (caching disabled if None)
     """
     return asyncio.run(
         amain(
@@ -168,5 +188,9 @@ def main(
             custom_reports,
             no_collapse,
             selected_constraints,
+            fail_on_warnings,
+            max_step_concurrency,
+            max_llm_concurrency,
+            cache_dir,
         )
     )
@@ -82,6 +82,8 @@ class FunctionalTestStep(BaseModel):
     """The name of the tool to call"""
     tool_arguments: dict[str, Any]
     """Realistic arguments to call the tool with"""
+    depends_on_previous: bool = True
+    """Whether this step relies on state created by earlier steps (e.g. reading a file a previous step wrote). Set to false only if the step can run independently."""
 
 
 class FunctionalTestStepOutput(BaseModel):
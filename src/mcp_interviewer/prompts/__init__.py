@@ -2,8 +2,10 @@ from ._generate_functional_test import generate_functional_test
 from ._score_functional_test_output import judge_functional_test_output
 from ._score_functional_test_step_output import score_functional_test_step_output
 from ._score_tool import judge_tool
+from .utils import PROMPT_VERSION
 
 __all__ = [
+    "PROMPT_VERSION",
     "judge_tool",
     "judge_functional_test_output",
     "score_functional_test_step_output",
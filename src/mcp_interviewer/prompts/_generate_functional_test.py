@@ -3,6 +3,8 @@ from openai.types.chat import ChatCompletionUserMessageParam
 from ..models import Client, FunctionalTest, Server
 from .utils import create_typed_completion
 
+_RESPONSE_SCHEMA = FunctionalTest.model_json_schema()
+
 
 async def generate_functional_test(client: Client, model: str, server: Server):
     tools_list = [
@@ -44,11 +46,12 @@ Guidelines:
 - Focus on positive test cases (expected to succeed).
 - Consider the tool descriptions and schemas carefully when generating arguments
 - For tools that might modify state, plan tests that can verify the modifications
+- Set depends_on_previous to false for steps that do not rely on any earlier step, so they can be run concurrently
 - If a tool requires external resources (files, URLs, etc.), use realistic examples
 
 Respond with a JSON object following this schema:
 ```json
-{FunctionalTest.model_json_schema()}
+{_RESPONSE_SCHEMA}
 ```
 
 
@@ -10,6 +10,8 @@ from ..models import (
 )
 from .utils import create_typed_completion
 
+_RESPONSE_SCHEMA = FunctionalTestEvaluationRubric.model_json_schema()
+
 
 async def judge_functional_test_output(
     client: Client,
@@ -46,7 +48,7 @@ Base your assessment on the actual evaluation data provided, considering both to
 Fill out the following rubric and return your evaluation as a JSON object. ONLY return the JSON, nothing else!
 
 ```json
-{FunctionalTestEvaluationRubric.model_json_schema()}
+{_RESPONSE_SCHEMA}
 ```
 """.strip()
 
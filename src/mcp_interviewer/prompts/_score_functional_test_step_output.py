@@ -9,6 +9,8 @@ from ..models import (
 )
 from .utils import create_typed_completion
 
+_RESPONSE_SCHEMA = FunctionalTestStepEvaluationRubric.model_json_schema()
+
 
 async def score_functional_test_step_output(
     client: Client,
@@ -34,7 +36,7 @@ Actual Output: {output.tool_output}
 Fill out the following rubric and return your evaluation as a JSON object. ONLY return the JSON, nothing else!
 
 ```json
-{FunctionalTestStepEvaluationRubric.model_json_schema()}
+{_RESPONSE_SCHEMA}
 ```
 """.strip()
 
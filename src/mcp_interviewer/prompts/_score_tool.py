@@ -4,6 +4,8 @@ from openai.types.chat import ChatCompletionUserMessageParam
 from ..models import Client, ToolScoreCard
 from .utils import create_typed_completion
 
+_RESPONSE_SCHEMA = ToolScoreCard.model_json_schema()
+
 
 async def judge_tool(client: Client, model: str, tool: Tool):
     prompt = f"""
@@ -20,7 +22,7 @@ You are tasked with evaluating the quality of an MCP (Model Context Protocol) to
 Fill out the following rubric and return your evaluation as a JSON object:
 
 ```json
-{ToolScoreCard.model_json_schema()}
+{_RESPONSE_SCHEMA}
 ```
 """.strip()
 
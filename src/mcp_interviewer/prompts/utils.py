@@ -1,9 +1,10 @@
 import inspect
-import json
 import logging
 from collections.abc import Sequence
 from typing import TypeVar
+from weakref import WeakKeyDictionary
 
+import openai
 import pydantic
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
@@ -16,18 +17,58 @@ from ..models import Client
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever a prompt template changes so cached LLM responses are invalidated
+PROMPT_VERSION = "v1"
 
-def parse_json_completion(completion: str):
+# Models each client's endpoint rejected JSON mode for, so later requests
+# skip it. Keyed weakly so the state lives and dies with the client.
+_JSON_MODE_UNSUPPORTED: WeakKeyDictionary[Client, set[str]] = WeakKeyDictionary()
+
+
+def _is_json_mode_error(error: openai.BadRequestError) -> bool:
+    """Check whether a 400 response rejected the requested response_format."""
+    if error.param == "response_format":
+        return True
+    message = error.message.lower()
+    return "response_format" in message or "json mode" in message
+
+
+def strip_json_completion(completion: str) -> str:
     completion = completion.strip()
     completion = completion.removeprefix("```json")
     completion = completion.strip("`")
-    completion = completion.strip()
-    return json.loads(completion)
+    return completion.strip()
 
 
 TResponseModel = TypeVar("TResponseModel", bound=BaseModel)
 
 
+async def _create_completion(
+    client: Client,
+    model: str,
+    messages: Sequence[ChatCompletionMessageParam],
+    json_mode: bool,
+):
+    if json_mode:
+        completion = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0,
+            response_format={"type": "json_object"},
+        )
+    else:
+        completion = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0,
+        )
+
+    if inspect.isawaitable(completion):
+        completion = await completion
+
+    return completion
+
+
 async def create_typed_completion(
     client: Client,
     model: str,
@@ -38,15 +79,20 @@ async def create_typed_completion(
     max_retries = max(0, max_retries)
     messages = list(initial_messages)
 
-    for _ in range(max_retries + 1):
-        completion = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=0,
-        )
+    json_mode_unsupported = _JSON_MODE_UNSUPPORTED.setdefault(client, set())
 
-        if inspect.isawaitable(completion):
-            completion = await completion
+    error: Exception | None = None
+    for _ in range(max_retries + 1):
+        json_mode = model not in json_mode_unsupported
+        try:
+            completion = await _create_completion(client, model, messages, json_mode)
+        except openai.BadRequestError as e:
+            if not json_mode or not _is_json_mode_error(e):
+                raise
+            # Not every OpenAI-compatible endpoint supports JSON mode
+            completion = await _create_completion(client, model, messages, False)
+            logger.info("JSON mode is not supported for %s, disabling it", model)
+            json_mode_unsupported.add(model)
 
         content = completion.choices[0].message.content
         messages.append(
@@ -57,19 +103,19 @@ async def create_typed_completion(
             raise ValueError("chat completion content was None")
 
         try:
-            response = parse_json_completion(content)
-            response = response_model.model_validate(response)
-            return response
-        except (json.decoder.JSONDecodeError, pydantic.ValidationError) as e:
-            print(content)
-            logger.exception("Error parsing json")
-            import traceback
-
-            tb_str = traceback.format_exc()
+            # Parse and validate in one pass; malformed JSON also raises
+            # a ValidationError
+            return response_model.model_validate_json(strip_json_completion(content))
+        except pydantic.ValidationError as e:
+            logger.warning("Error parsing json: %s", e)
+            logger.debug("Completion content: %s", content)
+            error = e
+            # The error message alone tells the model what to fix; a Python
+            # traceback would only inflate the retry prompt
             messages.append(
                 ChatCompletionUserMessageParam(
                     role="user",
-                    content=f"Error parsing json: {e}\nTraceback:\n{tb_str}",
+                    content=f"Error parsing json: {e}",
                 )
             )
-    raise Exception("Exceeded maximum retries")
+    raise Exception("Exceeded maximum retries") from error
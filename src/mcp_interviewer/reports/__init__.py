@@ -16,7 +16,7 @@ from .server import (
     ToolsReport,
 )
 from .statistics import ToolCallStatisticsReport, ToolStatisticsReport
-from .utils import count_scores, format_score, get_server_info
+from .utils import count_scores, format_json, format_score, get_server_info
 
 # Available report classes
 REPORT_CLASSES = [
@@ -51,6 +51,7 @@ def get_shorthand_codes() -> dict[str, str]:
 __all__ = [
     "BaseReport",
     "FullReport",
+    "format_json",
     "format_score",
     "count_scores",
     "get_server_info",
@@ -34,20 +34,19 @@ class BaseReport(ABC):
     def __init__(
         self,
         scorecard: ServerScoreCard,
-        violations: list[ConstraintViolation] = [],
+        violations: list[ConstraintViolation] | None = None,
         options: BaseReportOptions | None = None,
     ):
         """Initialize a new Report builder."""
         self._lines: list[str] = []
         self._scorecard = scorecard
-        self._violations = violations
+        self._violations = violations or []
         self._options = options or BaseReportOptions()
 
     def add_title(self, title: str, level: int = 1) -> "BaseReport":
         """Add a title to the report."""
         prefix = "#" * level
-        self.add_text(f"{prefix} {title}")
-        self.add_blank_line()
+        self.add_paragraph(f"{prefix} {title}")
         return self
 
     def add_text(self, text: str) -> "BaseReport":
@@ -55,6 +54,12 @@ class BaseReport(ABC):
         self._lines.append(text)
         return self
 
+    def add_paragraph(self, text: str) -> "BaseReport":
+        """Add a line of text followed by a blank line to the report."""
+        self._lines.append(text)
+        self._lines.append("")
+        return self
+
     def add_blank_line(self) -> "BaseReport":
         """Add a blank line to the report."""
         self._lines.append("")
@@ -69,13 +74,13 @@ class BaseReport(ABC):
 
     def add_table_header(self, columns: list[str]) -> "BaseReport":
         """Add a table header to the report."""
-        self._lines.append("| " + " | ".join(columns) + " |")
-        self._lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
+        self._lines.append(f"| {' | '.join(columns)} |")
+        self._lines.append(f"|{' --- |' * len(columns)}")
         return self
 
     def add_table_row(self, values: list[str]) -> "BaseReport":
         """Add a table row to the report."""
-        self._lines.append("| " + " | ".join(values) + " |")
+        self._lines.append(f"| {' | '.join(values)} |")
         return self
 
     def add_report(self, report: "BaseReport") -> "BaseReport":
@@ -45,12 +45,10 @@ class CustomReport(BaseReport):
         """Resolve report names, converting shorthand codes to full names."""
         resolved = []
         for name in names:
-            # Check if it's a shorthand code (uppercase)
-            if name.upper() in SHORTHAND_REPORT_MAPPING:
-                resolved.append(SHORTHAND_REPORT_MAPPING[name.upper()])
-            # Check if it's already a full name
-            elif name.lower() in REPORT_MAPPING:
-                resolved.append(name.lower())
+            # Check if it's a shorthand code (uppercase), then a full name
+            report_name = SHORTHAND_REPORT_MAPPING.get(name.upper(), name.lower())
+            if report_name in REPORT_MAPPING:
+                resolved.append(report_name)
             # Skip unknown names
         return resolved
 
@@ -60,10 +58,7 @@ class CustomReport(BaseReport):
         self.add_blank_line()
 
         for report_name in self.report_names:
-            if report_name not in REPORT_MAPPING:
-                # Skip unknown report names
-                continue
-
+            # Names were resolved against REPORT_MAPPING on construction
             report_class = REPORT_MAPPING[report_name]
 
             # Special handling for reports that need violations
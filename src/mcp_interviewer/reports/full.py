@@ -41,7 +41,7 @@ class FullReport(BaseReport):
         selected_constraints: list[str] | None = None,
     ):
         """Initialize and build the full report."""
-        super().__init__(scorecard, [], options)
+        super().__init__(scorecard, None, options)
         self._violations = violations
         self._selected_constraints = selected_constraints
         self._build()
@@ -1,8 +1,12 @@
 """Failed tests report generation."""
 
-from ...models import FunctionalTestScoreCard, ServerScoreCard
+from ...models import (
+    FunctionalTestScoreCard,
+    FunctionalTestStepScoreCard,
+    ServerScoreCard,
+)
 from ..base import BaseReport
-from .test_step import TestStepReport
+from .test_step import TestStepReport, failed_evaluation_fields
 
 
 class FailedTestsReport(BaseReport):
@@ -22,71 +26,58 @@ class FailedTestsReport(BaseReport):
         self.detailed = detailed
         self._build(scorecard.functional_test_scorecard)
 
-    def _has_failed_tests(
-        self, functional_test_scorecard: FunctionalTestScoreCard
-    ) -> bool:
-        """Check if there are any failed tests."""
-        for step in functional_test_scorecard.steps:
-            # Check if any evaluation criteria failed
-            for field_name in step.model_fields_set:
-                field_value = getattr(step, field_name)
-                if hasattr(field_value, "score") and field_value.score == "fail":
-                    return True
-        return False
-
     def _build(self, functional_test_scorecard: FunctionalTestScoreCard | None):
         """Build the failed tests section."""
         if functional_test_scorecard is None:
             return
 
-        if self._has_failed_tests(functional_test_scorecard):
+        # Find the failed criteria of every step once, for either layout
+        failed_steps = []
+        for i, step in enumerate(functional_test_scorecard.steps):
+            failures = _failed_criteria(step)
+            if failures:
+                failed_steps.append((i, step, failures))
+
+        if not failed_steps:
             return
 
         if self.detailed:
-            self._add_detailed_failed_test_steps(functional_test_scorecard)
+            self._add_detailed_failed_test_steps(failed_steps)
         else:
-            self._add_failed_test_steps(functional_test_scorecard)
+            self._add_failed_test_steps(failed_steps)
 
     def _add_failed_test_steps(
-        self, functional_test_scorecard: FunctionalTestScoreCard
+        self, failed_steps: list[tuple[int, FunctionalTestStepScoreCard, list[str]]]
     ) -> "FailedTestsReport":
         """Add a summary of failed test steps."""
         self.add_title("Failed Test Steps (🤖)", 2)
 
-        for i, step in enumerate(functional_test_scorecard.steps):
-            has_failure = False
-            failures = []
-
-            # Check each evaluation criteria
-            for field_name in step.model_fields_set:
-                field_value = getattr(step, field_name)
-                if hasattr(field_value, "score") and field_value.score == "fail":
-                    has_failure = True
-                    failures.append(field_name.replace("_", " ").title())
-
-            if has_failure:
-                self.add_text(
-                    f"**Step {i + 1}: {step.tool_name}** - Failed: {', '.join(failures)}"
-                )
+        for i, step, failures in failed_steps:
+            self.add_text(
+                f"**Step {i + 1}: {step.tool_name}** - Failed: {', '.join(failures)}"
+            )
 
         self.add_blank_line()
         return self
 
     def _add_detailed_failed_test_steps(
-        self, functional_test_scorecard: FunctionalTestScoreCard
+        self, failed_steps: list[tuple[int, FunctionalTestStepScoreCard, list[str]]]
     ) -> "FailedTestsReport":
         """Add detailed information about failed test steps."""
         self.add_title("Failed Test Steps (🤖)", 2)
 
-        for i, step in enumerate(functional_test_scorecard.steps):
-            # Use TestStepReport with show_only_failures=True
-            # This will only build the report if the step has failures
-            step_report = TestStepReport(
-                self._scorecard, step, i, show_only_failures=True
+        for i, step, _ in failed_steps:
+            # show_only_failures limits the step report to its failed criteria
+            self.add_report(
+                TestStepReport(self._scorecard, step, i, show_only_failures=True)
             )
 
-            # Only add if the step has failures (the report will have content)
-            if step_report.has_failures:
-                self.add_report(step_report)
-
         return self
+
+
+def _failed_criteria(step: FunctionalTestStepScoreCard) -> list[str]:
+    """Get the display names of the evaluation criteria a step failed."""
+    return [
+        field_name.replace("_", " ").title()
+        for field_name in failed_evaluation_fields(step)
+    ]
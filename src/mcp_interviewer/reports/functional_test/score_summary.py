@@ -39,14 +39,20 @@ class ScoreSummaryReport(BaseReport):
 
         if scoring_disabled:
             self.add_title("Score Summary", 2)
-            self.add_text("**Overall Score:** _Scoring disabled_")
-            self.add_blank_line()
+            self.add_paragraph("**Overall Score:** _Scoring disabled_")
             return
 
         self.add_title("Score Summary (🤖)", 2)
 
+        # Scores only live in the tool and functional test scorecards, so
+        # count each subtree once and derive the overall score from them
+        # instead of walking the whole server scorecard
+        tool_counts = [count_scores(tc) for tc in self._scorecard.tool_scorecards]
+        test_counts = count_scores(self._scorecard.functional_test_scorecard)
+
         # Calculate overall score first
-        total_passes, total_tests = count_scores(self._scorecard)
+        total_passes = sum(p for p, _ in tool_counts) + test_counts[0]
+        total_tests = sum(t for _, t in tool_counts) + test_counts[1]
         if total_tests > 0:
             percentage = (total_passes / total_tests) * 100
             self.add_text(
@@ -64,7 +70,7 @@ class ScoreSummaryReport(BaseReport):
         if self._scorecard.tool_scorecards:
             for i, tool_scorecard in enumerate(self._scorecard.tool_scorecards):
                 tool = self._scorecard.tools[i]
-                passes, total = count_scores(tool_scorecard)
+                passes, total = tool_counts[i]
                 if total > 0:
                     score_text = f"{passes}/{total}"
                     self.add_table_row(
@@ -96,7 +102,7 @@ class ScoreSummaryReport(BaseReport):
 
         # Functional test scores
         if self._scorecard.functional_test_scorecard:
-            passes, total = count_scores(self._scorecard.functional_test_scorecard)
+            passes, total = test_counts
             if total > 0:
                 score_text = f"{passes}/{total}"
                 self.add_table_row(
@@ -73,7 +73,6 @@ class FunctionalTestReport(BaseReport):
                 )
                 self.add_report(step_report)
         else:
-            self.add_text("_No test steps available_")
-            self.add_blank_line()
+            self.add_paragraph("_No test steps available_")
 
         self.end_collapsible()
@@ -2,13 +2,45 @@
 
 import json
 from collections import defaultdict
+from contextlib import suppress
 
 from mcp.types import TextResourceContents
 from tiktoken import encoding_for_model
 
 from ...models import FunctionalTestStepScoreCard, ServerScoreCard
 from ..base import BaseReport
-from ..utils import count_scores, format_score
+from ..utils import count_scores, format_json, format_score, truncate_text
+
+# Step evaluation criteria, in display order
+_EVALUATION_FIELDS = (
+    "meets_expectations",
+    "output_quality",
+    "output_relevance",
+    "schema_compliance",
+    "error_type",
+    "no_silent_error",
+    "error_handling",
+)
+
+# (request type, step field) of each MCP request counter, in display order
+_REQUEST_COUNT_FIELDS = (
+    ("Sampling", "sampling_requests"),
+    ("Elicitation", "elicitation_requests"),
+    ("List roots", "list_roots_requests"),
+    ("Logging", "logging_requests"),
+)
+
+# Characters a JSON document can start with, used to skip parsing plain text
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+
+def failed_evaluation_fields(step: FunctionalTestStepScoreCard) -> list[str]:
+    """Get the evaluation criteria a step failed, in display order."""
+    return [
+        field
+        for field in _EVALUATION_FIELDS
+        if getattr(getattr(step, field, None), "score", None) == "fail"
+    ]
 
 
 class TestStepReport(BaseReport):
@@ -46,11 +78,7 @@ class TestStepReport(BaseReport):
 
     def _check_for_failures(self) -> bool:
         """Check if this step has any failures."""
-        for field_name in self.step.model_fields_set:
-            field_value = getattr(self.step, field_name)
-            if hasattr(field_value, "score") and field_value.score == "fail":
-                return True
-        return False
+        return bool(failed_evaluation_fields(self.step))
 
     def _add_statistics(self):
         """Compute statistics for this test step."""
@@ -70,12 +98,10 @@ class TestStepReport(BaseReport):
                     tool_output_text += content.resource.text
 
             if tool_output_text:
-                try:
+                with suppress(Exception):
                     tokenizer = encoding_for_model("gpt-4o")
                     token_count = len(tokenizer.encode(tool_output_text))
                     stats["token_count"] = token_count
-                except:
-                    pass
 
             # Content type distribution
             distribution = defaultdict(int)
@@ -84,8 +110,7 @@ class TestStepReport(BaseReport):
             stats["content_types"] = dict(distribution)
 
         if stats and "token_count" in stats or "content_types" in stats:
-            self.add_text("**Output Statistics:**")
-            self.add_blank_line()
+            self.add_paragraph("**Output Statistics:**")
 
             self.add_table_header(["Metric", "Value"])
 
@@ -108,11 +133,13 @@ class TestStepReport(BaseReport):
 
     def _build(self):
         """Build the test step report."""
+        step = self.step
+
         # Create a collapsible section for each step
-        step_title = f"Step {self.step_index + 1}: {self.step.tool_name}"
-        if self.step.exception is not None:
+        step_title = f"Step {self.step_index + 1}: {step.tool_name}"
+        if step.exception is not None:
             step_title += " ❌"
-        elif self.step.tool_output is not None and self.step.tool_output.isError:
+        elif step.tool_output is not None and step.tool_output.isError:
             step_title += " ⚠️"
         else:
             step_title += " ✅"
@@ -123,83 +150,64 @@ class TestStepReport(BaseReport):
         # Start collapsible section if enabled
         if self._options.use_collapsible:
             self.add_text("<details>")
-            self.add_text("<summary>Toggle step details</summary>")
-            self.add_blank_line()
+            self.add_paragraph("<summary>Toggle step details</summary>")
 
         if self.include_evaluations:
-            passes, total = count_scores(self.step)
+            passes, total = count_scores(step)
             if total > 0:
-                self.add_text(f"Score (🤖): {passes}/{total}")
-                self.add_blank_line()
+                self.add_paragraph(f"Score (🤖): {passes}/{total}")
 
         # Link to tool details using tool name
-        self.add_text(f"[→ View tool details](#tool-{self.step.tool_name})")
-        self.add_blank_line()
+        self.add_paragraph(f"[→ View tool details](#tool-{step.tool_name})")
 
         # Justification
-        if self.step.justification:
-            self.add_text(f"**Reasoning (🤖):** {self.step.justification}")
-            self.add_blank_line()
+        if step.justification:
+            self.add_paragraph(f"**Reasoning (🤖):** {step.justification}")
 
         # Tool call
         self.add_text("**Tool Call (🤖):**")
-        self.add_code_block(json.dumps(self.step.tool_arguments, indent=2), "json")
+        self.add_code_block(format_json(step.tool_arguments), "json")
 
         # Expected output
-        if self.step.expected_output:
-            self.add_text(f"**Expected Output (🤖):** {self.step.expected_output}")
-            self.add_blank_line()
+        if step.expected_output:
+            self.add_paragraph(f"**Expected Output (🤖):** {step.expected_output}")
 
         # Actual output
-        if self.step.tool_output:
-            self.add_text(
-                f"**Actual Output ({len(self.step.tool_output.content)} blocks):**"
+        if step.tool_output:
+            self.add_paragraph(
+                f"**Actual Output ({len(step.tool_output.content)} blocks):**"
             )
-            self.add_blank_line()
-            self._add_tool_output(self.step.tool_output)
+            self._add_tool_output(step.tool_output)
 
         # Exception if any
-        if self.step.exception:
+        if step.exception:
             self.add_text("**Exception:**")
-            self.add_code_block(self.step.exception)
+            self.add_code_block(step.exception)
             self.add_blank_line()
 
         # Add statistics
         self._add_statistics()
 
         # Request counts for this step - display as a table
-        if any(
-            [
-                self.step.sampling_requests,
-                self.step.elicitation_requests,
-                self.step.list_roots_requests,
-                self.step.logging_requests,
-            ]
-        ):
-            self.add_text("**MCP Requests:**")
-            self.add_blank_line()
+        request_counts = [
+            (request_type, getattr(step, field_name))
+            for request_type, field_name in _REQUEST_COUNT_FIELDS
+        ]
+        if any(count for _, count in request_counts):
+            self.add_paragraph("**MCP Requests:**")
 
             self.add_table_header(["Request Type", "Count"])
-
-            if self.step.sampling_requests:
-                self.add_table_row(["Sampling", str(self.step.sampling_requests)])
-            if self.step.elicitation_requests:
-                self.add_table_row(["Elicitation", str(self.step.elicitation_requests)])
-            if self.step.list_roots_requests:
-                self.add_table_row(["List roots", str(self.step.list_roots_requests)])
-            if self.step.logging_requests:
-                self.add_table_row(["Logging", str(self.step.logging_requests)])
+            for request_type, count in request_counts:
+                if count:
+                    self.add_table_row([request_type, str(count)])
 
             self.add_blank_line()
 
         if self.include_evaluations:
             # Check if scoring was disabled
             scoring_disabled = False
-            if (
-                self.step.meets_expectations
-                and self.step.meets_expectations.score == "N/A"
-            ):
-                if "No score generated" in self.step.meets_expectations.justification:
+            if step.meets_expectations and step.meets_expectations.score == "N/A":
+                if "No score generated" in step.meets_expectations.justification:
                     scoring_disabled = True
 
             if not scoring_disabled:
@@ -207,18 +215,8 @@ class TestStepReport(BaseReport):
                 self.add_text("**Evaluation (🤖):**")
 
                 # Show all evaluations or just failures based on context
-                evaluation_fields = [
-                    "meets_expectations",
-                    "output_quality",
-                    "output_relevance",
-                    "schema_compliance",
-                    "error_type",
-                    "no_silent_error",
-                    "error_handling",
-                ]
-
-                for field_name in evaluation_fields:
-                    field_value = getattr(self.step, field_name, None)
+                for field_name in _EVALUATION_FIELDS:
+                    field_value = getattr(step, field_name, None)
                     if field_value and hasattr(field_value, "score"):
                         # Show all scores in full report, only failures in failed test section
                         if not self.show_only_failures or field_value.score == "fail":
@@ -244,34 +242,27 @@ class TestStepReport(BaseReport):
         for content in tool_output.content:
             if content.type == "text":
                 if content.text:
-                    output_str = content.text
-                    language = ""
-
-                    # Try to parse as JSON for better formatting
-                    try:
-                        parsed = json.loads(content.text)
-                        output_str = json.dumps(parsed, indent=2)
+                    # Try to parse as JSON for better formatting, truncating
+                    # either way if too long
+                    output_str = None
+                    if content.text.lstrip()[:1] in _JSON_START_CHARS:
+                        with suppress(Exception):
+                            output_str = format_json(json.loads(content.text), 500)
+                    if output_str is not None:
                         language = "json"
-                    except:
-                        pass
-
-                    # Truncate if too long
-                    if len(output_str) > 500:
-                        truncated_chars = len(output_str) - 500
-                        output_str = (
-                            output_str[:500]
-                            + f"\n... ({truncated_chars} chars truncated)"
-                        )
+                    else:
+                        output_str = truncate_text([content.text], 500)
+                        language = ""
 
                     self.add_code_block(output_str, language)
             elif content.type == "image":
                 text = f"[Image: {content.mimeType}]"
-                if hasattr(content, "data") and content.data:
+                if content.data:
                     text += f"\n\tSize: {len(content.data)} bytes (base64)"
                 self.add_code_block(text)
             elif content.type == "audio":
                 text = f"[Audio: {content.mimeType}]"
-                if hasattr(content, "data") and content.data:
+                if content.data:
                     text += f"\n\tSize: {len(content.data)} bytes (base64)"
                 self.add_code_block(text)
             elif content.type == "resource_link":
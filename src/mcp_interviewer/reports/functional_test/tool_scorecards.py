@@ -1,9 +1,29 @@
 """Tool scorecards report generation."""
 
+from pydantic import BaseModel
+
 from ...models import ServerScoreCard
 from ..base import BaseReport
 from ..utils import count_scores, format_score
 
+# (label, rubric field) of each scored aspect, in display order
+_NAME_ASPECTS = (
+    ("Length", "length"),
+    ("Uniqueness", "uniqueness"),
+    ("Descriptiveness", "descriptiveness"),
+)
+_DESCRIPTION_ASPECTS = (
+    ("Length", "length"),
+    ("Parameters", "parameters"),
+    ("Examples", "examples"),
+)
+_SCHEMA_ASPECTS = (
+    ("Complexity", "complexity"),
+    ("Parameters", "parameters"),
+    ("Optionals", "optionals"),
+    ("Constraints", "constraints"),
+)
+
 
 class ToolScorecardsReport(BaseReport):
     """Report for tool evaluation scorecards."""
@@ -39,10 +59,9 @@ class ToolScorecardsReport(BaseReport):
         if scoring_disabled:
             self.add_title("Tool Scorecards", 2)
             self.start_collapsible("Toggle details")
-            self.add_text(
+            self.add_paragraph(
                 "_Experimental tool judging disabled - no evaluations generated_"
             )
-            self.add_blank_line()
             self.end_collapsible()
             return
         else:
@@ -50,8 +69,7 @@ class ToolScorecardsReport(BaseReport):
             self.start_collapsible("Toggle details")
 
         if not self._scorecard.tool_scorecards:
-            self.add_text("_No tool evaluations available_")
-            self.add_blank_line()
+            self.add_paragraph("_No tool evaluations available_")
             self.end_collapsible()
             return
 
@@ -73,185 +91,50 @@ class ToolScorecardsReport(BaseReport):
         self.add_title(f"{tool.name}", 3)
 
         # Show score
-        self.add_text(f"**Score:** {passes}/{total} ({percentage:.0f}%)")
-        self.add_blank_line()
+        self.add_paragraph(f"**Score:** {passes}/{total} ({percentage:.0f}%)")
 
         # Link to tool details
-        self.add_text(f"[→ View tool details](#tool-{tool.name})")
-        self.add_blank_line()
+        self.add_paragraph(f"[→ View tool details](#tool-{tool.name})")
 
         # Start collapsible section for scorecard details
         if self._options.use_collapsible:
             self.add_text("<details>")
-            self.add_text("<summary>Toggle scorecard details</summary>")
-            self.add_blank_line()
+            self.add_paragraph("<summary>Toggle scorecard details</summary>")
 
-        # Tool Name Evaluation
-        if self._options.use_collapsible:
-            self.add_text("<details>")
-            self.add_text("<summary>Tool Name (🤖)</summary>")
-            self.add_blank_line()
-        else:
-            self.add_text("**Tool Name (🤖):**")
-            self.add_blank_line()
-        self.add_table_header(["Aspect", "Score", "Justification"])
-        self.add_table_row(
-            [
-                "Length",
-                format_score(scorecard.tool_name.length.score),
-                scorecard.tool_name.length.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Uniqueness",
-                format_score(scorecard.tool_name.uniqueness.score),
-                scorecard.tool_name.uniqueness.justification,
-            ]
+        self._add_aspect_table("Tool Name", scorecard.tool_name, _NAME_ASPECTS)
+        self._add_aspect_table(
+            "Tool Description", scorecard.tool_description, _DESCRIPTION_ASPECTS
         )
-        self.add_table_row(
-            [
-                "Descriptiveness",
-                format_score(scorecard.tool_name.descriptiveness.score),
-                scorecard.tool_name.descriptiveness.justification,
-            ]
+        self._add_aspect_table(
+            "Input Schema", scorecard.tool_input_schema, _SCHEMA_ASPECTS
         )
-        self.add_blank_line()
-
-        # End collapsible for Tool Name
-        if self._options.use_collapsible:
-            self.add_text("</details>")
-            self.add_blank_line()
+        if scorecard.tool_output_schema:
+            self._add_aspect_table(
+                "Output Schema", scorecard.tool_output_schema, _SCHEMA_ASPECTS
+            )
 
-        # Tool Description Evaluation
+        # End collapsible section for entire scorecard
         if self._options.use_collapsible:
-            self.add_text("<details>")
-            self.add_text("<summary>Tool Description (🤖)</summary>")
-            self.add_blank_line()
-        else:
-            self.add_text("**Tool Description (🤖):**")
-            self.add_blank_line()
-        self.add_table_header(["Aspect", "Score", "Justification"])
-        self.add_table_row(
-            [
-                "Length",
-                format_score(scorecard.tool_description.length.score),
-                scorecard.tool_description.length.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Parameters",
-                format_score(scorecard.tool_description.parameters.score),
-                scorecard.tool_description.parameters.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Examples",
-                format_score(scorecard.tool_description.examples.score),
-                scorecard.tool_description.examples.justification,
-            ]
-        )
-        self.add_blank_line()
+            self.add_paragraph("</details>")
 
-        # End collapsible for Tool Description
-        if self._options.use_collapsible:
-            self.add_text("</details>")
-            self.add_blank_line()
+        return self
 
-        # Input Schema Evaluation
+    def _add_aspect_table(
+        self, title: str, rubric: BaseModel, aspects: tuple[tuple[str, str], ...]
+    ) -> None:
+        """Add a table of aspect scores for one part of a tool scorecard."""
         if self._options.use_collapsible:
             self.add_text("<details>")
-            self.add_text("<summary>Input Schema (🤖)</summary>")
-            self.add_blank_line()
+            self.add_paragraph(f"<summary>{title} (🤖)</summary>")
         else:
-            self.add_text("**Input Schema (🤖):**")
-            self.add_blank_line()
+            self.add_paragraph(f"**{title} (🤖):**")
         self.add_table_header(["Aspect", "Score", "Justification"])
-        self.add_table_row(
-            [
-                "Complexity",
-                format_score(scorecard.tool_input_schema.complexity.score),
-                scorecard.tool_input_schema.complexity.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Parameters",
-                format_score(scorecard.tool_input_schema.parameters.score),
-                scorecard.tool_input_schema.parameters.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Optionals",
-                format_score(scorecard.tool_input_schema.optionals.score),
-                scorecard.tool_input_schema.optionals.justification,
-            ]
-        )
-        self.add_table_row(
-            [
-                "Constraints",
-                format_score(scorecard.tool_input_schema.constraints.score),
-                scorecard.tool_input_schema.constraints.justification,
-            ]
-        )
-        self.add_blank_line()
-
-        # End collapsible for Input Schema
-        if self._options.use_collapsible:
-            self.add_text("</details>")
-            self.add_blank_line()
-
-        # Output Schema Evaluation (if exists)
-        if scorecard.tool_output_schema:
-            if self._options.use_collapsible:
-                self.add_text("<details>")
-                self.add_text("<summary>Output Schema (🤖)</summary>")
-                self.add_blank_line()
-            else:
-                self.add_text("**Output Schema (🤖):**")
-                self.add_blank_line()
-            self.add_table_header(["Aspect", "Score", "Justification"])
+        for label, field_name in aspects:
+            score_card = getattr(rubric, field_name)
             self.add_table_row(
-                [
-                    "Complexity",
-                    format_score(scorecard.tool_output_schema.complexity.score),
-                    scorecard.tool_output_schema.complexity.justification,
-                ]
+                [label, format_score(score_card.score), score_card.justification]
             )
-            self.add_table_row(
-                [
-                    "Parameters",
-                    format_score(scorecard.tool_output_schema.parameters.score),
-                    scorecard.tool_output_schema.parameters.justification,
-                ]
-            )
-            self.add_table_row(
-                [
-                    "Optionals",
-                    format_score(scorecard.tool_output_schema.optionals.score),
-                    scorecard.tool_output_schema.optionals.justification,
-                ]
-            )
-            self.add_table_row(
-                [
-                    "Constraints",
-                    format_score(scorecard.tool_output_schema.constraints.score),
-                    scorecard.tool_output_schema.constraints.justification,
-                ]
-            )
-            self.add_blank_line()
-
-            # End collapsible for Output Schema
-            if self._options.use_collapsible:
-                self.add_text("</details>")
-                self.add_blank_line()
+        self.add_blank_line()
 
-        # End collapsible section for entire scorecard
         if self._options.use_collapsible:
-            self.add_text("</details>")
-            self.add_blank_line()
-
-        return self
+            self.add_paragraph("</details>")
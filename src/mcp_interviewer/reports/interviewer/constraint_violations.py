@@ -61,10 +61,10 @@ class ConstraintViolationsReport(BaseReport):
         ):
             constraint_prefix = f"{constraint.cli_name()} ({constraint.cli_code()})"
 
-            constraint_suffix = ""
-            for i, source in enumerate(constraint.sources()):
-                constraint_suffix += f"[[{i + 1}]]({source}) "
-            constraint_suffix = constraint_suffix.strip()
+            constraint_suffix = " ".join(
+                f"[[{i}]]({source})"
+                for i, source in enumerate(constraint.sources(), start=1)
+            )
 
             if violations:
                 for violation in violations:
@@ -79,7 +79,6 @@ class ConstraintViolationsReport(BaseReport):
 
                     self.add_blank_line()
             else:
-                self.add_text(f"✅ {constraint_prefix} {constraint_suffix}")
-                self.add_blank_line()
+                self.add_paragraph(f"✅ {constraint_prefix} {constraint_suffix}")
 
         self.end_collapsible()
@@ -26,6 +26,5 @@ class EmojiLegendReport(BaseReport):
         # self.add_text("- ✅: Feature meets requirements")
         # self.add_text("- ❌: Feature does not meet requirements")
         self.add_text("- ⚪: Feature not applicable or not tested")
-        self.add_text("- 🤖: AI-generated content")
+        self.add_paragraph("- 🤖: AI-generated content")
         # self.add_text("- 🧮: Computed metrics and data")
-        self.add_blank_line()
@@ -31,16 +31,13 @@ class InterviewerInfoReport(BaseReport):
 
         self.add_title("Metadata", 4)
         # Add date and version
-        self.add_text(f"**Date:** {datetime.now().strftime('%Y-%m-%d')}")
-        self.add_blank_line()
-        self.add_text(
+        self.add_paragraph(f"**Date:** {datetime.now().strftime('%Y-%m-%d')}")
+        self.add_paragraph(
             f"**mcp-interviewer Version:** [{__version__}](https://github.com/microsoft/mcp-interviewer)"
         )
-        self.add_blank_line()
 
         # Add model info
-        self.add_text(f"**Evaluation Model:** {self._scorecard.model}")
-        self.add_blank_line()
+        self.add_paragraph(f"**Evaluation Model:** {self._scorecard.model}")
 
         # Add CLI command from sys.argv
         if sys.argv:
@@ -60,28 +57,18 @@ class InterviewerInfoReport(BaseReport):
 
         params = self._scorecard.parameters
         if params.connection_type == "stdio":
-            self.add_text(f"**Command:** `{params.command}`")
-            self.add_blank_line()
+            self.add_paragraph(f"**Command:** `{params.command}`")
             if params.args:
-                self.add_text(
-                    f"**Arguments:** `{' '.join(str(arg) for arg in params.args)}`"
-                )
-                self.add_blank_line()
+                self.add_paragraph(f"**Arguments:** `{' '.join(params.args)}`")
             if params.env:
-                self.add_text(f"**Environment Variables:** {params.env}")
-                self.add_blank_line()
+                self.add_paragraph(f"**Environment Variables:** {params.env}")
         else:
             # For SSE and StreamableHttp
-            self.add_text(f"**URL:** `{params.url}`")
-            self.add_blank_line()
-            self.add_text(f"**Connection Type:** {params.connection_type}")
-            self.add_blank_line()
+            self.add_paragraph(f"**URL:** `{params.url}`")
+            self.add_paragraph(f"**Connection Type:** {params.connection_type}")
             if params.headers:
-                self.add_text(f"**Headers:** {params.headers}")
-                self.add_blank_line()
-            self.add_text(f"**Timeout:** {params.timeout}s")
-            self.add_blank_line()
-            self.add_text(f"**SSE Read Timeout:** {params.sse_read_timeout}s")
-            self.add_blank_line()
+                self.add_paragraph(f"**Headers:** {params.headers}")
+            self.add_paragraph(f"**Timeout:** {params.timeout}s")
+            self.add_paragraph(f"**SSE Read Timeout:** {params.sse_read_timeout}s")
 
         return self
@@ -23,5 +23,4 @@ class ModelInfoReport(BaseReport):
     def _build(self):
         """Build the model info section."""
         self.add_title("Evaluation Model Information", 2)
-        self.add_text(f"**Model:** {self._scorecard.model}")
-        self.add_blank_line()
+        self.add_paragraph(f"**Model:** {self._scorecard.model}")
@@ -1,9 +1,18 @@
 """Capabilities and feature counts report generation."""
 
+from typing import Any
+
 from ...models import ServerScoreCard
 from ..base import BaseReport
 
 
+def _enabled_flags(capability: Any, *flags: str) -> str:
+    """Comma-separated names of the flags set on a capability."""
+    if not capability:
+        return ""
+    return ", ".join(flag for flag in flags if getattr(capability, flag))
+
+
 class CapabilitiesReport(BaseReport):
     """Report for server capabilities and feature counts."""
 
@@ -33,67 +42,38 @@ class CapabilitiesReport(BaseReport):
 
         self.add_table_header(["Feature", "Supported", "Count", "Additional Features"])
 
-        # Tools capability
-        if capabilities.tools:
-            details = []
-            if capabilities.tools.listChanged:
-                details.append("listChanged")
-            details_str = ", ".join(details) if details else ""
-            self.add_table_row(
-                ["Tools", "✅", str(len(self._scorecard.tools)), details_str]
-            )
-        else:
-            self.add_table_row(["Tools", "❌", str(len(self._scorecard.tools)), ""])
-
-        # Resources capability
-        if capabilities.resources:
-            details = []
-            if capabilities.resources.subscribe:
-                details.append("subscribe")
-            if capabilities.resources.listChanged:
-                details.append("listChanged")
-            details_str = ", ".join(details) if details else ""
-            self.add_table_row(
-                ["Resources", "✅", str(len(self._scorecard.resources)), details_str]
-            )
-            self.add_table_row(
-                [
-                    "Resource Templates",
-                    "✅",
-                    str(len(self._scorecard.resource_templates)),
-                    "",
-                ]
-            )
-        else:
-            self.add_table_row(
-                ["Resources", "❌", str(len(self._scorecard.resources)), ""]
-            )
-            self.add_table_row(
-                [
-                    "Resource Templates",
-                    "❌",
-                    str(len(self._scorecard.resource_templates)),
-                    "",
-                ]
-            )
-
-        # Prompts capability
-        if capabilities.prompts:
-            details = []
-            if capabilities.prompts.listChanged:
-                details.append("listChanged")
-            details_str = ", ".join(details) if details else ""
+        # (feature, capability, count, additional features) per row
+        rows = [
+            (
+                "Tools",
+                capabilities.tools,
+                str(len(self._scorecard.tools)),
+                _enabled_flags(capabilities.tools, "listChanged"),
+            ),
+            (
+                "Resources",
+                capabilities.resources,
+                str(len(self._scorecard.resources)),
+                _enabled_flags(capabilities.resources, "subscribe", "listChanged"),
+            ),
+            (
+                "Resource Templates",
+                capabilities.resources,
+                str(len(self._scorecard.resource_templates)),
+                "",
+            ),
+            (
+                "Prompts",
+                capabilities.prompts,
+                str(len(self._scorecard.prompts)),
+                _enabled_flags(capabilities.prompts, "listChanged"),
+            ),
+            ("Logging", capabilities.logging, "", ""),
+        ]
+        for feature, capability, count, details_str in rows:
             self.add_table_row(
-                ["Prompts", "✅", str(len(self._scorecard.prompts)), details_str]
+                [feature, "✅" if capability else "❌", count, details_str]
             )
-        else:
-            self.add_table_row(["Prompts", "❌", str(len(self._scorecard.prompts)), ""])
-
-        # Logging capability
-        if capabilities.logging:
-            self.add_table_row(["Logging", "✅", "", ""])
-        else:
-            self.add_table_row(["Logging", "❌", "", ""])
 
         # Experimental features
         if capabilities.experimental:
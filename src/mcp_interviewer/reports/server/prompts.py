@@ -26,8 +26,7 @@ class PromptsReport(BaseReport):
         self.start_collapsible("Toggle details")
 
         if not self._scorecard.prompts:
-            self.add_text("_No prompts available_")
-            self.add_blank_line()
+            self.add_paragraph("_No prompts available_")
             self.end_collapsible()
             return
 
@@ -39,13 +38,11 @@ class PromptsReport(BaseReport):
             # Start collapsible for prompt details
             if self._options.use_collapsible:
                 self.add_text("<details>")
-                self.add_text("<summary>Toggle prompt details</summary>")
-                self.add_blank_line()
+                self.add_paragraph("<summary>Toggle prompt details</summary>")
 
             # Prompt description
             if prompt.description:
-                self.add_text(f"**Description:** {prompt.description}")
-                self.add_blank_line()
+                self.add_paragraph(f"**Description:** {prompt.description}")
 
             # Arguments if present
             if prompt.arguments:
@@ -62,7 +59,6 @@ class PromptsReport(BaseReport):
 
             # End collapsible for prompt details
             if self._options.use_collapsible:
-                self.add_text("</details>")
-                self.add_blank_line()
+                self.add_paragraph("</details>")
 
         self.end_collapsible()
@@ -1,9 +1,8 @@
 """Resource templates report generation."""
 
-import json
-
 from ...models import ServerScoreCard
 from ..base import BaseReport
+from ..utils import format_json
 
 
 class ResourceTemplatesReport(BaseReport):
@@ -28,8 +27,7 @@ class ResourceTemplatesReport(BaseReport):
         self.start_collapsible("Toggle details")
 
         if not self._scorecard.resource_templates:
-            self.add_text("_No resource templates available_")
-            self.add_blank_line()
+            self.add_paragraph("_No resource templates available_")
             self.end_collapsible()
             return
 
@@ -41,32 +39,27 @@ class ResourceTemplatesReport(BaseReport):
             # Start collapsible for template details
             if self._options.use_collapsible:
                 self.add_text("<details>")
-                self.add_text("<summary>Toggle template details</summary>")
-                self.add_blank_line()
+                self.add_paragraph("<summary>Toggle template details</summary>")
 
             # Template URI pattern
-            self.add_text(f"**URI Template:** `{template.uriTemplate}`")
-            self.add_blank_line()
+            self.add_paragraph(f"**URI Template:** `{template.uriTemplate}`")
 
             # Template description
             if template.description:
-                self.add_text(f"**Description:** {template.description}")
-                self.add_blank_line()
+                self.add_paragraph(f"**Description:** {template.description}")
 
             # MIME type
             if template.mimeType:
-                self.add_text(f"**MIME Type:** {template.mimeType}")
-                self.add_blank_line()
+                self.add_paragraph(f"**MIME Type:** {template.mimeType}")
 
             # Annotations if present
-            if hasattr(template, "annotations") and template.annotations:
+            if template.annotations:
                 self.add_text("**Annotations:**")
-                self.add_code_block(json.dumps(template.annotations, indent=2), "json")
+                self.add_code_block(format_json(template.annotations), "json")
                 self.add_blank_line()
 
             # End collapsible for template details
             if self._options.use_collapsible:
-                self.add_text("</details>")
-                self.add_blank_line()
+                self.add_paragraph("</details>")
 
         self.end_collapsible()
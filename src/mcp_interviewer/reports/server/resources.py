@@ -1,9 +1,8 @@
 """Resources report generation."""
 
-import json
-
 from ...models import ServerScoreCard
 from ..base import BaseReport
+from ..utils import format_json
 
 
 class ResourcesReport(BaseReport):
@@ -28,8 +27,7 @@ class ResourcesReport(BaseReport):
         self.start_collapsible("Toggle details")
 
         if not self._scorecard.resources:
-            self.add_text("_No resources available_")
-            self.add_blank_line()
+            self.add_paragraph("_No resources available_")
             self.end_collapsible()
             return
 
@@ -41,32 +39,27 @@ class ResourcesReport(BaseReport):
             # Start collapsible for resource details
             if self._options.use_collapsible:
                 self.add_text("<details>")
-                self.add_text("<summary>Toggle resource details</summary>")
-                self.add_blank_line()
+                self.add_paragraph("<summary>Toggle resource details</summary>")
 
             # Resource URI
-            self.add_text(f"**URI:** `{resource.uri}`")
-            self.add_blank_line()
+            self.add_paragraph(f"**URI:** `{resource.uri}`")
 
             # Resource description
             if resource.description:
-                self.add_text(f"**Description:** {resource.description}")
-                self.add_blank_line()
+                self.add_paragraph(f"**Description:** {resource.description}")
 
             # Resource mime type
             if resource.mimeType:
-                self.add_text(f"**MIME Type:** {resource.mimeType}")
-                self.add_blank_line()
+                self.add_paragraph(f"**MIME Type:** {resource.mimeType}")
 
             # Annotations if present
-            if hasattr(resource, "annotations") and resource.annotations:
+            if resource.annotations:
                 self.add_text("**Annotations:**")
-                self.add_code_block(json.dumps(resource.annotations, indent=2), "json")
+                self.add_code_block(format_json(resource.annotations), "json")
                 self.add_blank_line()
 
             # End collapsible for resource details
             if self._options.use_collapsible:
-                self.add_text("</details>")
-                self.add_blank_line()
+                self.add_paragraph("</details>")
 
         self.end_collapsible()
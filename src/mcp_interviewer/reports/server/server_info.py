@@ -34,23 +34,18 @@ class ServerInfoReport(BaseReport):
 
         # Always show name and version before collapsible
         if info["name"]:
-            self.add_text(f"**Name:** {info['name']}")
-            self.add_blank_line()
+            self.add_paragraph(f"**Name:** {info['name']}")
         if info["version"]:
-            self.add_text(f"**Version:** {info['version']}")
-            self.add_blank_line()
+            self.add_paragraph(f"**Version:** {info['version']}")
 
         # Put remaining info in collapsible section
         if self._options.use_collapsible:
             self.add_text("<details>")
-            self.add_text("<summary>Toggle details</summary>")
-            self.add_blank_line()
+            self.add_paragraph("<summary>Toggle details</summary>")
 
-        self.add_text(f"**Protocol Version:** {info['protocol_version']}")
-        self.add_blank_line()
+        self.add_paragraph(f"**Protocol Version:** {info['protocol_version']}")
 
-        self.add_text("**Instructions:**")
-        self.add_blank_line()
+        self.add_paragraph("**Instructions:**")
         if info["instructions"]:
             self.add_code_block(info["instructions"])
         else:
@@ -58,7 +53,6 @@ class ServerInfoReport(BaseReport):
         self.add_blank_line()
 
         if self._options.use_collapsible:
-            self.add_text("</details>")
-            self.add_blank_line()
+            self.add_paragraph("</details>")
 
         return self
@@ -1,9 +1,8 @@
 """Tools report generation."""
 
-import json
-
 from ...models import ServerScoreCard
 from ..base import BaseReport
+from ..utils import format_json
 
 
 class ToolsReport(BaseReport):
@@ -32,8 +31,7 @@ class ToolsReport(BaseReport):
         self.start_collapsible("Toggle details")
 
         if not self._scorecard.tools:
-            self.add_text("_No tools available_")
-            self.add_blank_line()
+            self.add_paragraph("_No tools available_")
             self.end_collapsible()
             return self
 
@@ -45,8 +43,7 @@ class ToolsReport(BaseReport):
             # Start collapsible for tool details
             if self._options.use_collapsible:
                 self.add_text("<details>")
-                self.add_text("<summary>Toggle tool details</summary>")
-                self.add_blank_line()
+                self.add_paragraph("<summary>Toggle tool details</summary>")
 
             # Tool description
             if tool.description:
@@ -56,21 +53,20 @@ class ToolsReport(BaseReport):
             # Input schema
             self.add_text("**Input Schema:**")
             if tool.inputSchema:
-                self.add_code_block(json.dumps(tool.inputSchema, indent=2), "json")
+                self.add_code_block(format_json(tool.inputSchema), "json")
             else:
                 self.add_text("_No Input Schema_")
 
             # Output schema
             self.add_text("**Output Schema:**")
             if tool.outputSchema:
-                self.add_code_block(json.dumps(tool.outputSchema, indent=2), "json")
+                self.add_code_block(format_json(tool.outputSchema), "json")
             else:
                 self.add_text("_No Output Schema_")
 
             # End collapsible for tool details
             if self._options.use_collapsible:
-                self.add_text("</details>")
-                self.add_blank_line()
+                self.add_paragraph("</details>")
 
         self.end_collapsible()
         return self
@@ -1,50 +1,115 @@
 """Utility functions for report generation."""
 
-from typing import Any
+import json
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, get_args
 
 from pydantic import BaseModel
 
 from ..models import PassFailScoreCard, ServerScoreCard
 
+# json.dumps builds a new encoder per call when given options, so share one
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def truncate_text(chunks: Iterable[str], limit: int) -> str:
+    """Join text chunks, truncating the result to at most limit characters.
+
+    Chunks past the limit are only measured, so a large text is never built
+    in full just to be cut down.
+    """
+    head = []
+    size = 0
+    for chunk in chunks:
+        if size < limit:
+            head.append(chunk)
+        size += len(chunk)
+
+    text = "".join(head)
+    if size > limit:
+        return text[:limit] + f"\n... ({size - limit} chars truncated)"
+    return text
+
+
+def format_json(obj: Any, limit: int | None = None) -> str:
+    """Format an object as indented JSON for a code block.
+
+    Args:
+        obj: The object to format
+        limit: Truncate the output to this many characters (no limit if None)
+    """
+    if limit is None:
+        return _PRETTY_JSON_ENCODER.encode(obj)
+    return truncate_text(_PRETTY_JSON_ENCODER.iterencode(obj), limit)
+
+
+_SCORE_EMOJI = {"pass": "✅", "fail": "❌", "N/A": "⚪"}
+
 
 def format_score(score: str) -> str:
     """Format a score with appropriate emoji."""
-    if score == "pass":
-        return "✅"
-    elif score == "fail":
-        return "❌"
-    elif score == "N/A":
-        return "⚪"
-    else:
-        return score
+    return _SCORE_EMOJI.get(score, score)
+
+
+# Types that can never contain a score card
+_LEAF_TYPES = (str, int, float, bool, type(None))
 
 
-def count_scores(obj: Any, path: str = "") -> tuple[int, int]:
+def _may_contain_scores(annotation: Any, seen: frozenset[type] = frozenset()) -> bool:
+    """Check whether a field annotation can hold a PassFailScoreCard."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if issubclass(annotation, PassFailScoreCard):
+            return True
+        if annotation in seen:
+            return False
+        return any(
+            _may_contain_scores(field.annotation, seen | {annotation})
+            for field in annotation.model_fields.values()
+        )
+    return any(_may_contain_scores(arg, seen) for arg in get_args(annotation))
+
+
+@cache
+def _scoring_fields(model: type[BaseModel]) -> frozenset[str]:
+    """Get the fields of a model that can hold score cards.
+
+    Free-form fields (e.g. tool arguments and outputs typed as Any) are
+    skipped, since they hold server or LLM JSON data rather than score cards.
+    """
+    return frozenset(
+        name
+        for name, field in model.model_fields.items()
+        if _may_contain_scores(field.annotation, frozenset({model}))
+    )
+
+
+def count_scores(obj: Any) -> tuple[int, int]:
     """Recursively count pass/fail scores. Returns (passes, total)."""
-    passes = 0
-    total = 0
+    if isinstance(obj, _LEAF_TYPES):
+        return 0, 0
 
     if isinstance(obj, PassFailScoreCard):
-        if obj.score != "N/A":
-            total += 1
-            if obj.score == "pass":
-                passes += 1
-    elif isinstance(obj, BaseModel):
-        for field_name in obj.model_fields_set:
-            field_value = getattr(obj, field_name)
-            p, t = count_scores(field_value, f"{path}.{field_name}")
-            passes += p
-            total += t
+        if obj.score == "N/A":
+            return 0, 0
+        return int(obj.score == "pass"), 1
+
+    if isinstance(obj, BaseModel):
+        fields = _scoring_fields(type(obj)) & obj.model_fields_set
+        values = [getattr(obj, field_name) for field_name in fields]
     elif isinstance(obj, dict):
-        for key, value in obj.items():
-            p, t = count_scores(value, f"{path}.{key}")
-            passes += p
-            total += t
+        values = obj.values()
     elif isinstance(obj, list):
-        for item in obj:
-            p, t = count_scores(item, path)
-            passes += p
-            total += t
+        values = obj
+    else:
+        return 0, 0
+
+    passes = 0
+    total = 0
+    for value in values:
+        p, t = count_scores(value)
+        passes += p
+        total += t
 
     return passes, total
 
@@ -68,11 +133,10 @@ def get_server_info(scorecard: ServerScoreCard) -> dict[str, str | None]:
     # Fallback title from parameters if not found
     if not info["title"]:
         if scorecard.parameters.connection_type == "stdio":
-            info["title"] = str(scorecard.parameters.command)
-            if scorecard.parameters.args:
-                info["title"] += " " + " ".join(
-                    str(arg) for arg in scorecard.parameters.args
-                )
+            info["title"] = " ".join(
+                str(part)
+                for part in [scorecard.parameters.command, *scorecard.parameters.args]
+            )
         else:
             # For SSE and StreamableHttp, use the URL as title
             info["title"] = str(scorecard.parameters.url)
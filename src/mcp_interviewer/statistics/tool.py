@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Generator
+from functools import cache
 from typing import cast
 
 import tiktoken
@@ -13,6 +14,16 @@ from .base import CompositeStatistic, ServerScoreCard, Statistic, StatisticValue
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _encoding_for_model(model: str) -> tiktoken.Encoding:
+    """Look up the tokenizer for a model once, falling back to o200k_base."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning("model %s not found. Using o200k_base encoding.", model)
+        return tiktoken.get_encoding("o200k_base")
+
+
 def num_tokens_for_tool(tool: ChatCompletionToolParam, model):
     """From https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb"""
 
@@ -35,7 +46,7 @@ def num_tokens_for_tool(tool: ChatCompletionToolParam, model):
     else:
         if model not in ["gpt-4o", "gpt-4o-mini"]:
             logger.warning(
-                f"""Unrecognized model {model}, defaulting to gpt-4o tokenizer settings."""
+                "Unrecognized model %s, defaulting to gpt-4o tokenizer settings.", model
             )
 
         # Set function settings for the above models
@@ -46,11 +57,7 @@ def num_tokens_for_tool(tool: ChatCompletionToolParam, model):
         enum_item = 3
         func_end = 12
 
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        logger.warning(f"model {model} not found. Using o200k_base encoding.")
-        encoding = tiktoken.get_encoding("o200k_base")
+    encoding = _encoding_for_model(model)
 
     func_token_count = 0
     func_token_count += func_init  # Add tokens for start of each function
@@ -219,6 +219,30 @@ def test_defs_keyword():
     assert len(violations) == 1
 
 
+def test_escaped_ref_name_resolved():
+    """Test that refs to definition names needing pointer escaping resolve."""
+    tool = Tool(
+        name="test_tool",
+        description="A test tool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user": {"$ref": "#/definitions/a~1User"},
+            },
+            "definitions": {
+                "a/User": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                },
+            },
+        },
+    )
+
+    constraint = ToolInputSchemaFlatnessConstraint()
+    violations = list(constraint.test_tool(tool))
+    assert len(violations) == 1
+
+
 @pytest.mark.parametrize("union_keyword", ["oneOf", "anyOf", "allOf"])
 def test_union_with_flat_schemas_passes(union_keyword):
     """Test that unions (oneOf/anyOf/allOf) with flat schemas pass."""
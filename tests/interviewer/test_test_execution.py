@@ -0,0 +1,102 @@
+"""Tests for functional test execution."""
+
+import asyncio
+
+from mcp.types import CallToolResult, TextContent
+
+from mcp_interviewer.interviewer import (
+    create_request_counters,
+    execute_functional_test,
+    partition_functional_test_steps,
+)
+from mcp_interviewer.models import FunctionalTest, FunctionalTestStep
+
+
+def make_step(tool_name: str, depends_on_previous: bool = True) -> FunctionalTestStep:
+    return FunctionalTestStep(
+        justification="",
+        expected_output="",
+        tool_name=tool_name,
+        tool_arguments={},
+        depends_on_previous=depends_on_previous,
+    )
+
+
+class FakeSession:
+    """Minimal stand-in for ClientSession that records call concurrency."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_tool(self, name, arguments):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.calls.append(name)
+        return CallToolResult(content=[TextContent(type="text", text=name)])
+
+
+def test_partition_groups_independent_steps():
+    """Test that independent steps join the preceding batch."""
+    steps = [
+        make_step("a"),
+        make_step("b", depends_on_previous=False),
+        make_step("c"),
+        make_step("d", depends_on_previous=False),
+        make_step("e", depends_on_previous=False),
+    ]
+
+    batches = partition_functional_test_steps(steps)
+    assert [[s.tool_name for s in batch] for batch in batches] == [
+        ["a", "b"],
+        ["c", "d", "e"],
+    ]
+
+
+def test_partition_first_step_always_starts_batch():
+    """Test that a leading independent step still starts the first batch."""
+    steps = [make_step("a", depends_on_previous=False), make_step("b")]
+
+    batches = partition_functional_test_steps(steps)
+    assert [[s.tool_name for s in batch] for batch in batches] == [["a"], ["b"]]
+
+
+def test_sequential_by_default():
+    """Test that steps run one at a time unless concurrency is enabled."""
+    steps = [make_step(name, depends_on_previous=False) for name in "abc"]
+    session = FakeSession()
+
+    _, outputs = asyncio.run(
+        execute_functional_test(
+            session,  # type: ignore[arg-type]
+            FunctionalTest(plan="", steps=steps),
+            create_request_counters(),
+        )
+    )
+
+    assert session.max_in_flight == 1
+    assert session.calls == ["a", "b", "c"]
+    assert len(outputs) == 3
+
+
+def test_concurrent_execution_preserves_order():
+    """Test that concurrent steps are bounded and outputs keep plan order."""
+    steps = [make_step("a")] + [
+        make_step(name, depends_on_previous=False) for name in "bcd"
+    ]
+    session = FakeSession()
+
+    _, outputs = asyncio.run(
+        execute_functional_test(
+            session,  # type: ignore[arg-type]
+            FunctionalTest(plan="", steps=steps),
+            create_request_counters(),
+            max_step_concurrency=2,
+        )
+    )
+
+    assert session.max_in_flight == 2
+    assert [o.tool_output.content[0].text for o in outputs] == ["a", "b", "c", "d"]
@@ -0,0 +1,53 @@
+"""Tests for LLMCache."""
+
+from mcp_interviewer.llm_cache import LLMCache
+from mcp_interviewer.models import PassFailScoreCard
+
+
+def test_round_trip(tmp_path):
+    """Test that a stored response is returned for the same key."""
+    cache = LLMCache(tmp_path / "cache")
+    key = cache.make_key("judge_tool", "v1", "gpt-4o", "{}")
+    response = PassFailScoreCard(justification="ok", score="pass")
+
+    assert cache.get(key, PassFailScoreCard) is None
+
+    cache.set(key, response)
+    assert cache.get(key, PassFailScoreCard) == response
+
+
+def test_key_depends_on_every_part():
+    """Test that changing or regrouping any part changes the key."""
+    key = LLMCache.make_key("a", "b")
+    assert key == LLMCache.make_key("a", "b")
+    assert key != LLMCache.make_key("a", "c")
+    assert key != LLMCache.make_key("ab")
+
+
+def test_invalid_entry_is_a_miss(tmp_path):
+    """Test that entries that no longer validate are ignored."""
+    cache = LLMCache(tmp_path)
+    key = cache.make_key("x")
+    (tmp_path / f"{key}.json").write_text('{"unexpected": true}')
+
+    assert cache.get(key, PassFailScoreCard) is None
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    """Test that entries that cannot be read are ignored."""
+    cache = LLMCache(tmp_path)
+    key = cache.make_key("x")
+    (tmp_path / f"{key}.json").mkdir()
+
+    assert cache.get(key, PassFailScoreCard) is None
+
+
+def test_failed_write_is_ignored(tmp_path):
+    """Test that a cache directory that cannot be written does not raise."""
+    blocker = tmp_path / "cache"
+    blocker.write_text("")
+    cache = LLMCache(blocker)
+    key = cache.make_key("x")
+
+    cache.set(key, PassFailScoreCard(justification="ok", score="pass"))
+    assert cache.get(key, PassFailScoreCard) is None